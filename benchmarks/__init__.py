@@ -0,0 +1,14 @@
+"""Microbenchmarks of the core transformations and configuration utilities.
+
+Run all benchmarks and compare them with the stored baseline by:
+
+.. code-block:: bash
+
+    python -m benchmarks
+    python -m benchmarks --filter se2 --save-baseline  # update part of the baseline
+
+Each benchmark is a factory that prepares the data and returns a function without
+arguments that is timed. The number of operations performed by a single call is
+stored next to the factory so that batched variants report operations per second
+of the underlying primitive.
+"""
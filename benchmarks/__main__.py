@@ -0,0 +1,120 @@
+#!/usr/bin/env python
+#
+# Copyright (c) CTU -- All Rights Reserved
+# Created on: 2026-10-18
+#
+
+"""Run the microbenchmarks and compare them with the stored baseline. The process
+exits with non-zero code if any benchmark is slower than the baseline by more than
+the given tolerance. Medians of repeated runs still vary by about 35 % between runs
+on the same machine, hence the default tolerance allows 60 % slowdown and only
+catches gross regressions."""
+
+from __future__ import annotations
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from collections.abc import Callable
+import numpy as np
+
+from benchmarks import bench_core, bench_configuration_utils, bench_spatial
+
+DEFAULT_BASELINE = Path(__file__).parent.joinpath("baseline.json")
+
+
+def measure(
+    factory: Callable[[], Callable], ops: int, min_time: float, repeat: int
+) -> dict:
+    """Measure operations per second and allocated bytes per operation of the function
+    created by the factory. Function is repeated until it runs at least min_time
+    seconds, the median of the given number of such repetitions is reported."""
+    np.random.seed(0)
+    fun = factory()
+    fun()
+    n = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(n):
+            fun()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            break
+        n *= 2 if elapsed < min_time / 10 else 10
+    times = [elapsed]
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(n):
+            fun()
+        times.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    base, _ = tracemalloc.get_traced_memory()
+    fun()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "ops_per_sec": n * ops / float(np.median(times)),
+        "alloc_bytes_per_op": (peak - base) / ops,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--filter", default="", help="Run benchmarks containing it.")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument(
+        "--save-baseline",
+        action="store_true",
+        help="Store the results into the baseline instead of comparing.",
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.6,
+        help="Allowed relative slowdown w.r.t. baseline, 0.6 fails below 0.4x.",
+    )
+    parser.add_argument("--min-time", type=float, default=0.05)
+    parser.add_argument("--repeat", type=int, default=7)
+    args = parser.parse_args(argv)
+
+    benchmarks = (
+        bench_core.benchmarks()
+        | bench_configuration_utils.benchmarks()
+        | bench_spatial.benchmarks()
+    )
+    baseline = json.loads(args.baseline.read_text()) if args.baseline.exists() else {}
+
+    results, regressions = {}, []
+    with np.errstate(all="ignore"):
+        for name, (factory, ops) in benchmarks.items():
+            if args.filter not in name:
+                continue
+            r = measure(factory, ops, args.min_time, args.repeat)
+            results[name] = r
+            line = (
+                f"{name:40s} {r['ops_per_sec']:14.1f} ops/s"
+                f" {r['alloc_bytes_per_op']:10.1f} B/op"
+            )
+            if name in baseline and not args.save_baseline:
+                ratio = r["ops_per_sec"] / baseline[name]["ops_per_sec"]
+                line += f" {ratio:6.2f}x"
+                if ratio < 1.0 - args.tolerance:
+                    regressions.append(name)
+                    line += " REGRESSION"
+            print(line)
+
+    if args.save_baseline:
+        args.baseline.write_text(json.dumps(baseline | results, indent=2) + "\n")
+    elif regressions:
+        print(f"{len(regressions)} benchmark(s) slower than baseline:")
+        print("\n".join(f"  {name}" for name in regressions))
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
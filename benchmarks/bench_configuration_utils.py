@@ -0,0 +1,72 @@
+#!/usr/bin/env python
+#
+# Copyright (c) CTU -- All Rights Reserved
+# Created on: 2026-10-18
+#
+
+"""Benchmarks of the configuration utilities, scalar and batched."""
+
+from __future__ import annotations
+from functools import partial
+from collections.abc import Callable
+import numpy as np
+
+from robotics_toolbox.core import SE2Batch, SE3Batch
+from robotics_toolbox.utils import (
+    interpolate,
+    distance_between_configurations,
+    discretize,
+)
+from benchmarks.bench_core import BATCH_SIZES, sample_se2, sample_se3
+
+
+def _configurations(space: str, n: int) -> np.ndarray | SE2Batch | SE3Batch:
+    """Sample n configurations of the given space: array, se2 or se3."""
+    if space == "se2":
+        return sample_se2(n)
+    elif space == "se3":
+        return sample_se3(n)
+    return np.random.uniform(-np.pi, np.pi, size=(n, 6))
+
+
+def _interpolate(space: str) -> Callable:
+    c = _configurations(space, 2)
+    a, b = c[0], c[1]
+    return lambda: interpolate(a, b, 0.1)
+
+
+def _distance(space: str) -> Callable:
+    c = _configurations(space, 2)
+    a, b = c[0], c[1]
+    return lambda: distance_between_configurations(a, b)
+
+
+def _distance_one_to_many(space: str, n: int) -> Callable:
+    a, b = _configurations(space, 1)[0], _configurations(space, n)
+    return lambda: distance_between_configurations(a, b)
+
+
+def _discretize(space: str, n: int) -> Callable:
+    """Discretize path into n configurations."""
+    c = _configurations(space, 2)
+    a, b = c[0], c[1]
+    step = distance_between_configurations(a, c[1:])[0] / n
+    return lambda: discretize(a, b, step)
+
+
+def benchmarks() -> dict[str, tuple[Callable[[], Callable], int]]:
+    """All benchmarks of this module, name: (factory, operations per call). Scalar
+    interpolation and distance of poses rely on homework stubs and are benchmarked
+    for joint space configurations only."""
+    out = {
+        "interpolate.array": (partial(_interpolate, "array"), 1),
+        "distance.array": (partial(_distance, "array"), 1),
+    }
+    for space in ("array", "se2", "se3"):
+        for n in BATCH_SIZES:
+            out[f"distance_one_to_many[{n}].{space}"] = (
+                partial(_distance_one_to_many, space, n),
+                n,
+            )
+            out[f"discretize[{n}].{space}"] = (partial(_discretize, space, n), n)
+    return out
@@ -0,0 +1,111 @@
+#!/usr/bin/env python
+#
+# Copyright (c) CTU -- All Rights Reserved
+# Created on: 2026-10-18
+#
+
+"""Benchmarks of the core transformations, scalar and batched."""
+
+from __future__ import annotations
+from functools import partial
+from collections.abc import Callable
+import numpy as np
+
+from robotics_toolbox.core import SO3, SE2, SE3, SE2Batch, SO3Batch, SE3Batch
+
+BATCH_SIZES = (1, 100, 10000)
+
+
+def sample_se2(n: int) -> SE2Batch:
+    """Sample n random SE2 transformations."""
+    return SE2Batch(
+        np.random.uniform(-1, 1, size=(n, 2)), np.random.uniform(-np.pi, np.pi, n)
+    )
+
+
+def sample_se3(n: int) -> SE3Batch:
+    """Sample n random SE3 transformations."""
+    return SE3Batch(
+        np.random.uniform(-1, 1, size=(n, 3)),
+        SO3Batch.exp(np.random.uniform(-1, 1, size=(n, 3))),
+    )
+
+
+def _construct(cls: type) -> Callable:
+    """Construct the identity of the given class."""
+    return lambda: cls()
+
+
+def _construct_se2_unchecked() -> Callable:
+    a = sample_se2(1)
+    return lambda: SE2.from_arrays_unchecked(a.translation[0], a.rotation.rot[0])
+
+
+def _compose(sample: Callable[[int], SE2Batch | SE3Batch], n: int) -> Callable:
+    """Compose two batches of n transformations."""
+    a, b = sample(n), sample(n)
+    return lambda: a * b
+
+
+def _compose_into(sample: Callable[[int], SE2Batch | SE3Batch]) -> Callable:
+    a, b, out = sample(1)[0], sample(1)[0], sample(1)[0]
+    return lambda: a.compose_into(b, out)
+
+
+def _inverse(sample: Callable[[int], SE2Batch | SE3Batch], n: int) -> Callable:
+    """Inverse of the batch of n transformations."""
+    a = sample(n)
+    return lambda: a.inverse()
+
+
+def _act(sample: Callable[[int], SE2Batch | SE3Batch], n: int) -> Callable:
+    """Act of the batch of n transformations on n vectors."""
+    a = sample(n)
+    v = np.random.uniform(-1, 1, size=(n, a.translation.shape[1]))
+    return lambda: a.act(v)
+
+
+def _act_point_cloud(n: int) -> Callable:
+    """Rotate the block of n points by a single rotation into preallocated buffer."""
+    r, v = sample_se3(1).rotation[0], np.random.uniform(-1, 1, size=(n, 3))
+    out = np.empty_like(v)
+    return lambda: r.act(v, out=out)
+
+
+def _exp(n: int) -> Callable:
+    """Exponential map of n rotation vectors."""
+    v = np.random.uniform(-1, 1, size=(n, 3))
+    return lambda: SO3Batch.exp(v)
+
+
+def _log(n: int) -> Callable:
+    """Logarithm of n rotations."""
+    r = sample_se3(n).rotation
+    return lambda: r.log()
+
+
+def benchmarks() -> dict[str, tuple[Callable[[], Callable], int]]:
+    """All benchmarks of this module, name: (factory, operations per call). Scalar
+    operations that are homework stubs (SO2 construction, SE2/SE3 compose, inverse
+    and act, SO3 exp and log) are not benchmarked."""
+    out = {
+        "so3.construct": (partial(_construct, SO3), 1),
+        "se3.construct": (partial(_construct, SE3), 1),
+        "se2.construct_unchecked": (_construct_se2_unchecked, 1),
+        "se2.compose_into": (partial(_compose_into, sample_se2), 1),
+        "se3.compose_into": (partial(_compose_into, sample_se3), 1),
+    }
+    for n in BATCH_SIZES:
+        prefix = f"_batch[{n}]"
+        out |= {
+            f"se2{prefix}.compose": (partial(_compose, sample_se2, n), n),
+            f"se2{prefix}.inverse": (partial(_inverse, sample_se2, n), n),
+            f"se2{prefix}.act": (partial(_act, sample_se2, n), n),
+            f"se3{prefix}.compose": (partial(_compose, sample_se3, n), n),
+            f"se3{prefix}.inverse": (partial(_inverse, sample_se3, n), n),
+            f"se3{prefix}.act": (partial(_act, sample_se3, n), n),
+            f"so3{prefix}.exp": (partial(_exp, n), n),
+            f"so3{prefix}.log": (partial(_log, n), n),
+            f"so3.act_point_cloud[{n}]": (partial(_act_point_cloud, n), n),
+        }
+    return out
@@ -0,0 +1,46 @@
+#!/usr/bin/env python
+#
+# Copyright (c) CTU -- All Rights Reserved
+# Created on: 2026-10-18
+#
+
+"""Benchmarks of the spatial manipulator collision checking. They require Panda
+model of example-robot-data, otherwise none is run."""
+
+from __future__ import annotations
+from collections.abc import Callable
+from functools import partial
+from importlib.util import find_spec
+
+from robotics_toolbox.robots import SpatialManipulator
+
+BATCH_SIZES = (10, 1000)
+
+
+def _panda() -> SpatialManipulator:
+    return SpatialManipulator(robot_name="panda", headless=True)
+
+
+def _in_collision_loop(n: int) -> Callable:
+    """Check n configurations one by one."""
+    robot = _panda()
+    q = robot.sample_configurations(n)
+    return lambda: [robot.in_collision_at(qi) for qi in q]
+
+
+def _in_collision_batch(n: int) -> Callable:
+    """Check n configurations by a single batch call."""
+    robot = _panda()
+    q = robot.sample_configurations(n)
+    return lambda: robot.in_collision_batch(q)
+
+
+def benchmarks() -> dict[str, tuple[Callable[[], Callable], int]]:
+    """All benchmarks of this module, name: (factory, operations per call)."""
+    if find_spec("example_robot_data") is None:
+        return {}
+    out = {}
+    for n in BATCH_SIZES:
+        out[f"spatial.in_collision_loop[{n}]"] = (partial(_in_collision_loop, n), n)
+        out[f"spatial.in_collision_batch[{n}]"] = (partial(_in_collision_batch, n), n)
+    return out
@@ -1,11 +1,30 @@
 """Core functionality for the robotics_toolbox package is defined by transformations in
 2D and 3D space. This module implements these transformations as classes that can be
 used to represent and manipulate rotations and translations in 2D and 3D space.
+Batch variants hold N transformations in contiguous arrays and vectorize the
+operations over the whole batch.
 """
 
+from .pose_key import PoseKey
 from .so2 import SO2
 from .so3 import SO3
 from .se2 import SE2
 from .se3 import SE3
+from .so2_batch import SO2Batch
+from .se2_batch import SE2Batch
+from .so3_batch import SO3Batch
+from .se3_batch import SE3Batch
+from .so3_quaternion import SO3Quaternion
 
-__all__ = ["SO2", "SO3", "SE2", "SE3"]
+__all__ = [
+    "SO2",
+    "SO3",
+    "SE2",
+    "SE3",
+    "SO2Batch",
+    "SE2Batch",
+    "SO3Batch",
+    "SE3Batch",
+    "SO3Quaternion",
+    "PoseKey",
+]
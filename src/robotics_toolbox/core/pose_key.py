@@ -0,0 +1,41 @@
+#!/usr/bin/env python
+#
+# Copyright (c) CTU -- All Rights Reserved
+# Created on: 2026-10-18
+#
+
+"""Module for value based hashing of transformations."""
+
+from __future__ import annotations
+from typing import TYPE_CHECKING
+import numpy as np
+from numpy.typing import ArrayLike
+
+if TYPE_CHECKING:
+    from robotics_toolbox.core import SO2, SO3, SE2, SE3
+
+
+def quantize(values: ArrayLike, resolution: float) -> tuple[int, ...]:
+    """Round values to the nearest multiple of resolution and return the multiples as
+    a tuple of integers that can be used as a dictionary key."""
+    return tuple(np.rint(np.ravel(values) / resolution).astype(np.int64).tolist())
+
+
+class PoseKey:
+    """Hashable wrapper of a transformation that compares transformations by their
+    quantized values. Two transformations that are equal up to the resolution
+    usually share the key, i.e., the key can be used for memoization in dict/set."""
+
+    def __init__(self, pose: SO2 | SO3 | SE2 | SE3, resolution: float = 1e-6) -> None:
+        super().__init__()
+        self.pose = pose
+        self.key = (type(pose).__name__, pose.key(resolution))
+
+    def __eq__(self, other: PoseKey) -> bool:
+        return isinstance(other, PoseKey) and self.key == other.key
+
+    def __hash__(self):
+        return hash(self.key)
+
+    def __repr__(self):
+        return f"PoseKey({self.pose})"
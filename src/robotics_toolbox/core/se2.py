@@ -14,6 +14,7 @@ import numpy as np
 from numpy.typing import ArrayLike
 
 from robotics_toolbox.core import SO2
+from robotics_toolbox.core.pose_key import quantize
 
 
 class SE2:
@@ -31,7 +32,9 @@ class SE2:
         """
         super().__init__()
         self.translation = (
-            np.asarray(translation) if translation is not None else np.zeros(2)
+            np.asarray(translation, dtype=float)
+            if translation is not None
+            else np.zeros(2)
         )
         assert self.translation.shape == (2,)
         if isinstance(rotation, SO2):
@@ -41,6 +44,16 @@ class SE2:
         else:
             self.rotation = SO2()
 
+    @staticmethod
+    def from_arrays_unchecked(translation: np.ndarray, rot: np.ndarray) -> SE2:
+        """Create transformation from (2,) float translation and (2, 2) float
+        rotation matrix that are used without conversion, copy or validation.
+        Intended for internal hot paths."""
+        t = SE2.__new__(SE2)
+        t.translation = translation
+        t.rotation = SO2.from_matrix_unchecked(rot)
+        return t
+
     def __mul__(self, other: SE2) -> SE2:
         """Compose two transformation, i.e., self * other"""
         # todo: HW01: implement composition of two transformation.
@@ -51,6 +64,26 @@ class SE2:
         # todo: HW1 implement inverse
         return SE2()
 
+    def compose_into(self, other: SE2, out: SE2) -> SE2:
+        """Compose two transformations, i.e., self * other, and store the result into
+        the existing buffers of @param out, which can be also self or other. Returns
+        out."""
+        if out is self:
+            out.translation += self.rotation.act(other.translation)
+        else:
+            self.rotation.act(other.translation, out=out.translation)
+            out.translation += self.translation
+        self.rotation.compose_into(other.rotation, out.rotation)
+        return out
+
+    def inverse_into(self, out: SE2) -> SE2:
+        """Store inverse of the transformation into the existing buffers of @param out,
+        which can be also self. Returns out."""
+        self.rotation.inverse_into(out.rotation)
+        out.rotation.act(self.translation, out=out.translation)
+        np.negative(out.translation, out=out.translation)
+        return out
+
     def act(self, vector: ArrayLike) -> np.ndarray:
         """Transform given 2D vector by this SE2 transformation."""
         v = np.asarray(vector)
@@ -80,6 +113,11 @@ class SE2:
     def __hash__(self):
         return id(self)
 
+    def key(self, resolution: float = 1e-6) -> tuple[int, ...]:
+        """Return hashable key of the transformation quantized with the given
+        resolution. Use PoseKey to store transformations in dict/set by their value."""
+        return quantize(self.translation, resolution) + self.rotation.key(resolution)
+
     def __repr__(self):
         return (
             f"SE2(translation={self.translation}, rotation=SO2({self.rotation.angle}))"
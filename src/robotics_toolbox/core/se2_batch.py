@@ -0,0 +1,114 @@
+#!/usr/bin/env python
+#
+# Copyright (c) CTU -- All Rights Reserved
+# Created on: 2026-10-18
+#
+
+"""Module for representing a batch of 2D transformations."""
+
+from __future__ import annotations
+import numpy as np
+from numpy.typing import ArrayLike
+
+from robotics_toolbox.core import SE2, SO2Batch
+
+
+class SE2Batch:
+    """Batch of N SE2 transformations stored as contiguous (N, 2) translations and
+    SO2Batch rotations. Operations are vectorized over the whole batch."""
+
+    def __init__(
+        self,
+        translation: ArrayLike | None = None,
+        rotation: SO2Batch | ArrayLike | None = None,
+    ) -> None:
+        """Create a batch of SE2 transformations.
+
+        Attributes:
+        :param translation: (N, 2) array of translations, zeros by default
+        :param rotation: SO2Batch, (N,) angles [rad] or (N, 2, 2) rotation matrices,
+            identities by default
+        """
+        super().__init__()
+        self.translation = (
+            np.asarray(translation, dtype=float).reshape(-1, 2)
+            if translation is not None
+            else None
+        )
+        if isinstance(rotation, SO2Batch):
+            self.rotation = rotation
+        elif rotation is None:
+            n = len(self.translation) if self.translation is not None else 0
+            self.rotation = SO2Batch(np.zeros(n))
+        elif np.ndim(rotation) == 3:
+            self.rotation = SO2Batch.from_matrices(rotation)
+        else:
+            self.rotation = SO2Batch(rotation)
+        if self.translation is None:
+            self.translation = np.zeros((len(self.rotation), 2))
+        assert len(self.translation) == len(self.rotation)
+
+    @staticmethod
+    def from_poses(poses: list[SE2]) -> SE2Batch:
+        """Stack a list of SE2 instances into a batch."""
+        return SE2Batch(
+            np.asarray([p.translation for p in poses], dtype=float).reshape(-1, 2),
+            SO2Batch.from_rotations([p.rotation for p in poses]),
+        )
+
+    def __len__(self) -> int:
+        return self.translation.shape[0]
+
+    def __getitem__(self, item: int | slice | ArrayLike) -> SE2 | SE2Batch:
+        """Return a single SE2 for integer index and a sub-batch otherwise."""
+        if isinstance(item, (int, np.integer)):
+            return SE2.from_arrays_unchecked(
+                self.translation[item].copy(), self.rotation.rot[item].copy()
+            )
+        return SE2Batch(self.translation[item], self.rotation[item])
+
+    def __mul__(self, other: SE2Batch | SE2) -> SE2Batch:
+        """Compose transformations element-wise, i.e., self[i] * other[i]. Batch of
+        size one or a single SE2 is broadcast against the other operand."""
+        if isinstance(other, SE2):
+            other = SE2Batch.from_poses([other])
+        return SE2Batch(
+            self.rotation.act(other.translation) + self.translation,
+            self.rotation * other.rotation,
+        )
+
+    def inverse(self) -> SE2Batch:
+        """Compute inverse of all transformations in the batch."""
+        rotation = self.rotation.inverse()
+        return SE2Batch(-rotation.act(self.translation), rotation)
+
+    def act(self, vectors: ArrayLike) -> np.ndarray:
+        """Transform vectors by the transformations in the batch. Single (2,) vector is
+        transformed by all transformations, (N, 2) vectors are transformed
+        element-wise. Returns (N, 2) array."""
+        return self.rotation.act(vectors) + self.translation
+
+    def homogeneous(self) -> np.ndarray:
+        """Return (N, 3, 3) array of homogeneous transformation matrices."""
+        h = np.zeros((len(self), 3, 3))
+        h[:, :2, :2] = self.rotation.rot
+        h[:, :2, 2] = self.translation
+        h[:, 2, 2] = 1.0
+        return h
+
+    def __eq__(self, other: SE2Batch) -> bool:
+        """Returns true if all transformations in the batches are almost equal."""
+        return (
+            self.translation.shape == other.translation.shape
+            and np.allclose(self.translation, other.translation)
+            and self.rotation == other.rotation
+        )
+
+    def __hash__(self):
+        return id(self)
+
+    def __repr__(self):
+        return (
+            f"SE2Batch(translation={self.translation}, "
+            f"rotation=SO2Batch({self.rotation.angle}))"
+        )
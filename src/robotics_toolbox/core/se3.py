@@ -12,6 +12,7 @@ import numpy as np
 from numpy.typing import ArrayLike
 
 from robotics_toolbox.core import SO3
+from robotics_toolbox.core.pose_key import quantize
 
 
 class SE3:
@@ -23,11 +24,23 @@ class SE3:
         """Crete an SE3 transformation. Identity is the default."""
         super().__init__()
         self.translation = (
-            np.asarray(translation) if translation is not None else np.zeros(3)
+            np.asarray(translation, dtype=float)
+            if translation is not None
+            else np.zeros(3)
         )
         self.rotation = rotation if rotation is not None else SO3()
         assert self.translation.shape == (3,)
 
+    @staticmethod
+    def from_arrays_unchecked(translation: np.ndarray, rot: np.ndarray) -> SE3:
+        """Create transformation from (3,) float translation and (3, 3) float
+        rotation matrix that are used without conversion, copy or validation.
+        Intended for internal hot paths."""
+        t = SE3.__new__(SE3)
+        t.translation = translation
+        t.rotation = SO3.from_matrix_unchecked(rot)
+        return t
+
     def __mul__(self, other: SE3) -> SE3:
         """Compose two transformation, i.e., self * other"""
         # todo: HW01: implement composition of two transformation.
@@ -38,6 +51,26 @@ class SE3:
         # todo: HW1 implement inverse
         return SE3()
 
+    def compose_into(self, other: SE3, out: SE3) -> SE3:
+        """Compose two transformations, i.e., self * other, and store the result into
+        the existing buffers of @param out, which can be also self or other. Returns
+        out."""
+        if out is self:
+            out.translation += self.rotation.act(other.translation)
+        else:
+            self.rotation.act(other.translation, out=out.translation)
+            out.translation += self.translation
+        self.rotation.compose_into(other.rotation, out.rotation)
+        return out
+
+    def inverse_into(self, out: SE3) -> SE3:
+        """Store inverse of the transformation into the existing buffers of @param out,
+        which can be also self. Returns out."""
+        self.rotation.inverse_into(out.rotation)
+        out.rotation.act(self.translation, out=out.translation)
+        np.negative(out.translation, out=out.translation)
+        return out
+
     def act(self, vector: ArrayLike) -> np.ndarray:
         """Rotate given 3D vector by this transformation."""
         v = np.asarray(vector)
@@ -67,5 +100,10 @@ class SE3:
     def __hash__(self):
         return id(self)
 
+    def key(self, resolution: float = 1e-6) -> tuple[int, ...]:
+        """Return hashable key of the transformation quantized with the given
+        resolution. Use PoseKey to store transformations in dict/set by their value."""
+        return quantize(self.translation, resolution) + self.rotation.key(resolution)
+
     def __repr__(self):
         return f"(translation={self.translation}, log_rotation={self.rotation.log()})"
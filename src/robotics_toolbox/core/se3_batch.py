@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+#
+# Copyright (c) CTU -- All Rights Reserved
+# Created on: 2026-10-18
+#
+
+"""Module for representing a batch of 3D transformations."""
+
+from __future__ import annotations
+import numpy as np
+from numpy.typing import ArrayLike
+
+from robotics_toolbox.core import SE3, SO3Batch
+
+
+class SE3Batch:
+    """Batch of N SE3 transformations stored as contiguous (N, 3) translations and
+    SO3Batch rotations. Operations are vectorized over the whole batch."""
+
+    def __init__(
+        self,
+        translation: ArrayLike | None = None,
+        rotation: SO3Batch | None = None,
+    ) -> None:
+        """Create a batch of SE3 transformations. Translations default to zeros and
+        rotations to identities."""
+        super().__init__()
+        self.translation = (
+            np.asarray(translation, dtype=float).reshape(-1, 3)
+            if translation is not None
+            else np.zeros((len(rotation) if rotation is not None else 0, 3))
+        )
+        self.rotation = (
+            rotation if rotation is not None else SO3Batch.identity(len(self))
+        )
+        assert len(self.translation) == len(self.rotation)
+
+    @staticmethod
+    def from_poses(poses: list[SE3]) -> SE3Batch:
+        """Stack a list of SE3 instances into a batch."""
+        return SE3Batch(
+            np.asarray([p.translation for p in poses], dtype=float).reshape(-1, 3),
+            SO3Batch.from_rotations([p.rotation for p in poses]),
+        )
+
+    def __len__(self) -> int:
+        return self.translation.shape[0]
+
+    def __getitem__(self, item: int | slice | ArrayLike) -> SE3 | SE3Batch:
+        """Return a single SE3 for integer index and a sub-batch otherwise."""
+        if isinstance(item, (int, np.integer)):
+            return SE3.from_arrays_unchecked(
+                self.translation[item].copy(), self.rotation.rot[item].copy()
+            )
+        return SE3Batch(self.translation[item], self.rotation[item])
+
+    def __mul__(self, other: SE3Batch | SE3) -> SE3Batch:
+        """Compose transformations element-wise, i.e., self[i] * other[i]. Batch of
+        size one or a single SE3 is broadcast against the other operand."""
+        if isinstance(other, SE3):
+            other = SE3Batch.from_poses([other])
+        return SE3Batch(
+            self.rotation.act(other.translation) + self.translation,
+            self.rotation * other.rotation,
+        )
+
+    def inverse(self) -> SE3Batch:
+        """Compute inverse of all transformations in the batch."""
+        rotation = self.rotation.inverse()
+        return SE3Batch(-rotation.act(self.translation), rotation)
+
+    def act(self, vectors: ArrayLike) -> np.ndarray:
+        """Transform vectors by the transformations in the batch. Single (3,) vector is
+        transformed by all transformations, (N, 3) vectors are transformed
+        element-wise. Returns (N, 3) array."""
+        return self.rotation.act(vectors) + self.translation
+
+    def homogeneous(self) -> np.ndarray:
+        """Return (N, 4, 4) array of homogeneous transformation matrices."""
+        h = np.zeros((len(self), 4, 4))
+        h[:, :3, :3] = self.rotation.rot
+        h[:, :3, 3] = self.translation
+        h[:, 3, 3] = 1.0
+        return h
+
+    def __eq__(self, other: SE3Batch) -> bool:
+        """Returns true if all transformations in the batches are almost equal."""
+        return (
+            self.translation.shape == other.translation.shape
+            and np.allclose(self.translation, other.translation)
+            and self.rotation == other.rotation
+        )
+
+    def __hash__(self):
+        return id(self)
+
+    def __repr__(self):
+        return (
+            f"SE3Batch(translation={self.translation}, "
+            f"log_rotation={self.rotation.log()})"
+        )
@@ -11,6 +11,8 @@ from __future__ import annotations
 import numpy as np
 from numpy.typing import ArrayLike
 
+from robotics_toolbox.core.pose_key import quantize
+
 
 class SO2:
     """This class represents an SO2 rotations internally represented by rotation
@@ -24,6 +26,14 @@ class SO2:
         # todo HW01: implement computation of rotation matrix from the given angle
         self.rot: np.ndarray = np.zeros((2, 2))
 
+    @staticmethod
+    def from_matrix_unchecked(rot: np.ndarray) -> SO2:
+        """Create rotation from the given (2, 2) float rotation matrix that is used
+        without conversion, copy or validation. Intended for internal hot paths."""
+        t = SO2.__new__(SO2)
+        t.rot = rot
+        return t
+
     def __mul__(self, other: SO2) -> SO2:
         """Compose two rotations, i.e., self * other"""
         # todo: HW01: implement composition of two rotation.
@@ -42,11 +52,24 @@ class SO2:
         # todo: HW01: implement inverse, do not use np.linalg.inverse()
         pass
 
-    def act(self, vector: ArrayLike) -> np.ndarray:
-        """Rotate given vector by this transformation."""
+    def compose_into(self, other: SO2, out: SO2) -> SO2:
+        """Compose two rotations, i.e., self * other, and store the result into the
+        existing buffer of @param out, which can be also self or other. Returns out."""
+        np.matmul(self.rot, other.rot, out=out.rot)
+        return out
+
+    def inverse_into(self, out: SO2) -> SO2:
+        """Store inverse of the transformation into the existing buffer of @param out,
+        which can be also self. Returns out."""
+        out.rot[...] = self.rot.T
+        return out
+
+    def act(self, vector: ArrayLike, out: np.ndarray | None = None) -> np.ndarray:
+        """Rotate given vector (2,) or a block of vectors (N, 2) by this
+        transformation. Result is written into @param out if provided."""
         v = np.asarray(vector)
-        assert v.shape == (2,)
-        return self.rot @ v
+        assert v.shape[-1:] == (2,) and v.ndim <= 2
+        return np.matmul(v, self.rot.T, out=out)
 
     def __eq__(self, other: SO2) -> bool:
         """Returns true if two transformations are almost equal."""
@@ -54,3 +77,8 @@ class SO2:
 
     def __hash__(self):
         return id(self)
+
+    def key(self, resolution: float = 1e-6) -> tuple[int, ...]:
+        """Return hashable key of the rotation quantized with the given resolution.
+        Use PoseKey to store rotations in dict/set by their value."""
+        return quantize(self.rot[:, 0], resolution)
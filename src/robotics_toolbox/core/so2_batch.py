@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+#
+# Copyright (c) CTU -- All Rights Reserved
+# Created on: 2026-10-18
+#
+
+"""Module for representing a batch of 2D rotations."""
+
+from __future__ import annotations
+import numpy as np
+from numpy.typing import ArrayLike
+
+from robotics_toolbox.core import SO2
+
+
+class SO2Batch:
+    """Batch of N SO2 rotations internally represented by (N, 2, 2) array of rotation
+    matrices. Operations are vectorized over the whole batch."""
+
+    def __init__(self, angles: ArrayLike | None = None) -> None:
+        """Create a batch of rotations from (N,) angles [rad]. Empty batch is
+        created by default."""
+        super().__init__()
+        a = np.zeros(0) if angles is None else np.asarray(angles, dtype=float)
+        assert a.ndim == 1
+        c, s = np.cos(a), np.sin(a)
+        self.rot: np.ndarray = np.stack((c, -s, s, c), axis=-1).reshape(-1, 2, 2)
+
+    @staticmethod
+    def from_matrices(rot: ArrayLike) -> SO2Batch:
+        """Create a batch from (N, 2, 2) array of rotation matrices."""
+        r = np.asarray(rot, dtype=float)
+        assert r.ndim == 3 and r.shape[1:] == (2, 2)
+        t = SO2Batch()
+        t.rot = r
+        return t
+
+    @staticmethod
+    def from_rotations(rotations: list[SO2]) -> SO2Batch:
+        """Stack a list of SO2 instances into a batch."""
+        return SO2Batch.from_matrices(
+            np.asarray([r.rot for r in rotations], dtype=float).reshape(-1, 2, 2)
+        )
+
+    def __len__(self) -> int:
+        return self.rot.shape[0]
+
+    def __getitem__(self, item: int | slice | ArrayLike) -> SO2 | SO2Batch:
+        """Return a single SO2 for integer index and a sub-batch otherwise."""
+        if isinstance(item, (int, np.integer)):
+            return SO2.from_matrix_unchecked(self.rot[item].copy())
+        return SO2Batch.from_matrices(self.rot[item])
+
+    def __mul__(self, other: SO2Batch | SO2) -> SO2Batch:
+        """Compose rotations element-wise, i.e., self[i] * other[i]. Batch of size one
+        or a single SO2 is broadcast against the other operand."""
+        if isinstance(other, SO2):
+            other = SO2Batch.from_matrices(other.rot[np.newaxis])
+        return SO2Batch.from_matrices(self.rot @ other.rot)
+
+    @property
+    def angle(self) -> np.ndarray:
+        """Return (N,) angles [rad] of the rotations."""
+        return np.arctan2(self.rot[:, 1, 0], self.rot[:, 0, 0])
+
+    def inverse(self) -> SO2Batch:
+        """Return inverse of all rotations in the batch."""
+        return SO2Batch.from_matrices(np.swapaxes(self.rot, -1, -2))
+
+    def act(self, vectors: ArrayLike) -> np.ndarray:
+        """Rotate vectors by the rotations in the batch. Single (2,) vector is rotated
+        by all rotations, (N, 2) vectors are rotated element-wise. Returns (N, 2)."""
+        v = np.asarray(vectors)
+        assert v.shape[-1] == 2 and v.ndim <= 2
+        return np.matmul(self.rot, v[..., np.newaxis])[..., 0]
+
+    def __eq__(self, other: SO2Batch) -> bool:
+        """Returns true if all rotations in the batches are almost equal."""
+        return self.rot.shape == other.rot.shape and np.allclose(self.rot, other.rot)
+
+    def __hash__(self):
+        return id(self)
+
+    def __repr__(self):
+        return f"SO2Batch(angle={self.angle})"
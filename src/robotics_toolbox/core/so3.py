@@ -11,6 +11,8 @@ from __future__ import annotations
 import numpy as np
 from numpy.typing import ArrayLike
 
+from robotics_toolbox.core.pose_key import quantize
+
 
 class SO3:
     """This class represents an SO3 rotations internally represented by rotation
@@ -20,7 +22,9 @@ class SO3:
         """Creates a rotation transformation from rot_vector."""
         super().__init__()
         self.rot: np.ndarray = (
-            np.asarray(rotation_matrix) if rotation_matrix is not None else np.eye(3)
+            np.asarray(rotation_matrix, dtype=float)
+            if rotation_matrix is not None
+            else np.eye(3)
         )
 
     @staticmethod
@@ -39,6 +43,14 @@ class SO3:
         v = np.zeros(3)
         return v
 
+    @staticmethod
+    def from_matrix_unchecked(rot: np.ndarray) -> SO3:
+        """Create rotation from the given (3, 3) float rotation matrix that is used
+        without conversion, copy or validation. Intended for internal hot paths."""
+        t = SO3.__new__(SO3)
+        t.rot = rot
+        return t
+
     def __mul__(self, other: SO3) -> SO3:
         """Compose two rotations, i.e., self * other"""
         # todo: HW01: implement composition of two rotation.
@@ -49,11 +61,24 @@ class SO3:
         # todo: HW01: implement inverse, do not use np.linalg.inverse()
         return SO3()
 
-    def act(self, vector: ArrayLike) -> np.ndarray:
-        """Rotate given vector by this transformation."""
+    def compose_into(self, other: SO3, out: SO3) -> SO3:
+        """Compose two rotations, i.e., self * other, and store the result into the
+        existing buffer of @param out, which can be also self or other. Returns out."""
+        np.matmul(self.rot, other.rot, out=out.rot)
+        return out
+
+    def inverse_into(self, out: SO3) -> SO3:
+        """Store inverse of the transformation into the existing buffer of @param out,
+        which can be also self. Returns out."""
+        out.rot[...] = self.rot.T
+        return out
+
+    def act(self, vector: ArrayLike, out: np.ndarray | None = None) -> np.ndarray:
+        """Rotate given vector (3,) or a block of vectors (N, 3) by this
+        transformation. Result is written into @param out if provided."""
         v = np.asarray(vector)
-        assert v.shape == (3,)
-        return self.rot @ v
+        assert v.shape[-1:] == (3,) and v.ndim <= 2
+        return np.matmul(v, self.rot.T, out=out)
 
     def __eq__(self, other: SO3) -> bool:
         """Returns true if two transformations are almost equal."""
@@ -110,3 +135,8 @@ class SO3:
 
     def __hash__(self):
         return id(self)
+
+    def key(self, resolution: float = 1e-6) -> tuple[int, ...]:
+        """Return hashable key of the rotation quantized with the given resolution.
+        Use PoseKey to store rotations in dict/set by their value."""
+        return quantize(self.rot, resolution)
@@ -0,0 +1,127 @@
+#!/usr/bin/env python
+#
+# Copyright (c) CTU -- All Rights Reserved
+# Created on: 2026-10-18
+#
+
+"""Module for representing a batch of 3D rotations."""
+
+from __future__ import annotations
+import numpy as np
+from numpy.typing import ArrayLike
+
+from robotics_toolbox.core import SO3
+
+
+def _skew(v: np.ndarray) -> np.ndarray:
+    """Return (N, 3, 3) skew-symmetric matrices for (N, 3) vectors."""
+    z = np.zeros(v.shape[0])
+    x, y, w = v[:, 0], v[:, 1], v[:, 2]
+    return np.stack((z, -w, y, w, z, -x, -y, x, z), axis=-1).reshape(-1, 3, 3)
+
+
+class SO3Batch:
+    """Batch of N SO3 rotations internally represented by (N, 3, 3) array of rotation
+    matrices. Operations are vectorized over the whole batch."""
+
+    def __init__(self, rotation_matrices: ArrayLike | None = None) -> None:
+        """Create a batch of rotations from (N, 3, 3) rotation matrices. Empty batch
+        is created by default."""
+        super().__init__()
+        self.rot: np.ndarray = (
+            np.asarray(rotation_matrices, dtype=float)
+            if rotation_matrices is not None
+            else np.zeros((0, 3, 3))
+        )
+        assert self.rot.ndim == 3 and self.rot.shape[1:] == (3, 3)
+
+    @staticmethod
+    def identity(n: int) -> SO3Batch:
+        """Return batch of n identity rotations."""
+        return SO3Batch(np.broadcast_to(np.eye(3), (n, 3, 3)).copy())
+
+    @staticmethod
+    def from_rotations(rotations: list[SO3]) -> SO3Batch:
+        """Stack a list of SO3 instances into a batch."""
+        return SO3Batch(
+            np.asarray([r.rot for r in rotations], dtype=float).reshape(-1, 3, 3)
+        )
+
+    @staticmethod
+    def exp(rot_vectors: ArrayLike) -> SO3Batch:
+        """Compute rotations from (N, 3) rotation vectors by Rodrigues' formula. Taylor
+        expansion of the coefficients is used for small angles."""
+        v = np.asarray(rot_vectors, dtype=float).reshape(-1, 3)
+        theta = np.linalg.norm(v, axis=-1)
+        small = theta < 1e-6
+        t = np.where(small, 1.0, theta)
+        a = np.where(small, 1.0 - theta**2 / 6.0, np.sin(t) / t)
+        b = np.where(small, 0.5 - theta**2 / 24.0, (1.0 - np.cos(t)) / t**2)
+        k = _skew(v)
+        return SO3Batch(np.eye(3) + a[:, None, None] * k + b[:, None, None] * (k @ k))
+
+    def log(self) -> np.ndarray:
+        """Compute (N, 3) rotation vectors of the rotations. Small angles are handled by
+        Taylor expansion and angles close to pi by extracting the axis from the
+        symmetric part of the rotation matrix."""
+        r = self.rot
+        vee = np.stack(
+            (r[:, 2, 1] - r[:, 1, 2], r[:, 0, 2] - r[:, 2, 0], r[:, 1, 0] - r[:, 0, 1]),
+            axis=-1,
+        )
+        cos = (np.trace(r, axis1=1, axis2=2) - 1.0) / 2.0
+        theta = np.arctan2(np.linalg.norm(vee, axis=-1) / 2.0, cos)
+        small = theta < 1e-6
+        near_pi = theta > np.pi - 1e-3
+        s = np.where(small | near_pi, 1.0, np.sin(theta))
+        f = np.where(small, 0.5 + theta**2 / 12.0, theta / (2.0 * s))
+        v = f[:, None] * vee
+
+        # Near pi: symmetric part of R gives a a^T = (sym(R) - cos I) / (1 - cos); the
+        # column with the largest diagonal is used to obtain the axis a and the sign
+        # is taken from the (small) antisymmetric part.
+        c = np.where(near_pi, cos, -1.0)[:, None, None]
+        b = ((r + np.swapaxes(r, -1, -2)) / 2.0 - c * np.eye(3)) / (1.0 - c)
+        diag = np.diagonal(b, axis1=1, axis2=2)
+        k = np.argmax(diag, axis=-1)
+        idx = np.arange(r.shape[0])
+        axis = b[idx, :, k] / np.sqrt(np.maximum(diag[idx, k], 1e-12))[:, None]
+        sign = np.where(np.sum(axis * vee, axis=-1) < 0, -1.0, 1.0)
+        return np.where(near_pi[:, None], (sign * theta)[:, None] * axis, v)
+
+    def __len__(self) -> int:
+        return self.rot.shape[0]
+
+    def __getitem__(self, item: int | slice | ArrayLike) -> SO3 | SO3Batch:
+        """Return a single SO3 for integer index and a sub-batch otherwise."""
+        if isinstance(item, (int, np.integer)):
+            return SO3.from_matrix_unchecked(self.rot[item].copy())
+        return SO3Batch(self.rot[item])
+
+    def __mul__(self, other: SO3Batch | SO3) -> SO3Batch:
+        """Compose rotations element-wise, i.e., self[i] * other[i]. Batch of size one
+        or a single SO3 is broadcast against the other operand."""
+        if isinstance(other, SO3):
+            other = SO3Batch(other.rot[np.newaxis])
+        return SO3Batch(self.rot @ other.rot)
+
+    def inverse(self) -> SO3Batch:
+        """Return inverse of all rotations in the batch."""
+        return SO3Batch(np.swapaxes(self.rot, -1, -2))
+
+    def act(self, vectors: ArrayLike) -> np.ndarray:
+        """Rotate vectors by the rotations in the batch. Single (3,) vector is rotated
+        by all rotations, (N, 3) vectors are rotated element-wise. Returns (N, 3)."""
+        v = np.asarray(vectors)
+        assert v.shape[-1] == 3 and v.ndim <= 2
+        return np.matmul(self.rot, v[..., np.newaxis])[..., 0]
+
+    def __eq__(self, other: SO3Batch) -> bool:
+        """Returns true if all rotations in the batches are almost equal."""
+        return self.rot.shape == other.rot.shape and np.allclose(self.rot, other.rot)
+
+    def __hash__(self):
+        return id(self)
+
+    def __repr__(self):
+        return f"SO3Batch(log={self.log()})"
@@ -0,0 +1,182 @@
+#!/usr/bin/env python
+#
+# Copyright (c) CTU -- All Rights Reserved
+# Created on: 2026-10-18
+#
+
+"""Module for representing 3D rotation by a unit quaternion."""
+
+from __future__ import annotations
+import numpy as np
+from numpy.typing import ArrayLike
+
+from robotics_toolbox.core import SO3
+from robotics_toolbox.core.pose_key import quantize
+
+
+class SO3Quaternion:
+    """This class represents an SO3 rotation internally represented by a unit
+    quaternion [qx, qy, qz, qw]. The rotation matrix .rot is computed lazily on the
+    first access. Composition is computed by the quaternion product and the quaternion
+    is renormalized after every RENORMALIZATION_PERIOD compositions to prevent drift.
+    The instance can be used as a rotation of SE3."""
+
+    RENORMALIZATION_PERIOD = 16
+
+    def __init__(self, q: ArrayLike | None = None) -> None:
+        """Creates a rotation from a unit quaternion [qx, qy, qz, qw]. Identity is
+        the default."""
+        super().__init__()
+        self.q: np.ndarray = (
+            np.array(q, dtype=float) if q is not None else np.array([0, 0, 0, 1.0])
+        )
+        assert self.q.shape == (4,)
+        self._rot: np.ndarray | None = None
+        self._compositions = 0
+
+    @staticmethod
+    def exp(rot_vector: ArrayLike) -> SO3Quaternion:
+        """Compute rotation from a given rotation vector."""
+        v = np.array(rot_vector, dtype=float)
+        assert v.shape == (3,)
+        theta = np.linalg.norm(v)
+        if theta < 1e-6:
+            s = 0.5 - theta**2 / 48.0
+        else:
+            s = np.sin(theta / 2) / theta
+        return SO3Quaternion(np.append(s * v, np.cos(theta / 2)))
+
+    def log(self) -> np.ndarray:
+        """Compute rotation vector from this rotation."""
+        v, w = self.q[:3], self.q[3]
+        if w < 0:
+            v, w = -v, -w
+        n = np.linalg.norm(v)
+        if n < 1e-6:
+            return 2.0 * v / w
+        return 2.0 * np.arctan2(n, w) / n * v
+
+    @staticmethod
+    def from_so3(rotation: SO3) -> SO3Quaternion:
+        """Compute quaternion representation of the given rotation matrix."""
+        r = rotation.rot
+        trace = np.trace(r)
+        if trace > 0:
+            s = 2.0 * np.sqrt(trace + 1.0)
+            q = [
+                (r[2, 1] - r[1, 2]) / s,
+                (r[0, 2] - r[2, 0]) / s,
+                (r[1, 0] - r[0, 1]) / s,
+                s / 4.0,
+            ]
+        else:
+            i = int(np.argmax(np.diagonal(r)))
+            j, k = (i + 1) % 3, (i + 2) % 3
+            s = 2.0 * np.sqrt(1.0 + r[i, i] - r[j, j] - r[k, k])
+            q = np.empty(4)
+            q[i] = s / 4.0
+            q[j] = (r[j, i] + r[i, j]) / s
+            q[k] = (r[k, i] + r[i, k]) / s
+            q[3] = (r[k, j] - r[j, k]) / s
+        t = SO3Quaternion(q)
+        t.normalize()
+        return t
+
+    def to_so3(self) -> SO3:
+        """Return rotation represented by rotation matrix."""
+        return SO3(self.rot.copy())
+
+    @property
+    def rot(self) -> np.ndarray:
+        """Rotation matrix view of the quaternion, computed on the first access."""
+        if self._rot is None:
+            x, y, z, w = self.q
+            self._rot = np.array(
+                [
+                    [1 - 2 * (y * y + z * z), 2 * (x * y - z * w), 2 * (x * z + y * w)],
+                    [2 * (x * y + z * w), 1 - 2 * (x * x + z * z), 2 * (y * z - x * w)],
+                    [2 * (x * z - y * w), 2 * (y * z + x * w), 1 - 2 * (x * x + y * y)],
+                ]
+            )
+        return self._rot
+
+    def normalize(self) -> SO3Quaternion:
+        """Normalize the quaternion in place. Returns self."""
+        self.q /= np.linalg.norm(self.q)
+        self._rot = None
+        self._compositions = 0
+        return self
+
+    def __mul__(self, other: SO3Quaternion | SO3) -> SO3Quaternion:
+        """Compose two rotations, i.e., self * other"""
+        return self.compose_into(other, SO3Quaternion())
+
+    def compose_into(
+        self, other: SO3Quaternion | SO3, out: SO3Quaternion
+    ) -> SO3Quaternion:
+        """Compose two rotations, i.e., self * other, and store the result into the
+        existing buffer of @param out, which can be also self or other. Returns out."""
+        if not isinstance(other, SO3Quaternion):
+            other = SO3Quaternion.from_so3(other)
+        x1, y1, z1, w1 = self.q
+        x2, y2, z2, w2 = other.q
+        compositions = max(self._compositions, other._compositions) + 1
+        out.q[0] = w1 * x2 + x1 * w2 + y1 * z2 - z1 * y2
+        out.q[1] = w1 * y2 - x1 * z2 + y1 * w2 + z1 * x2
+        out.q[2] = w1 * z2 + x1 * y2 - y1 * x2 + z1 * w2
+        out.q[3] = w1 * w2 - x1 * x2 - y1 * y2 - z1 * z2
+        out._rot = None
+        out._compositions = compositions
+        if compositions >= self.RENORMALIZATION_PERIOD:
+            out.normalize()
+        return out
+
+    def inverse(self) -> SO3Quaternion:
+        """Return inverse of the rotation."""
+        return self.inverse_into(SO3Quaternion())
+
+    def inverse_into(self, out: SO3Quaternion) -> SO3Quaternion:
+        """Store inverse of the rotation into the existing buffer of @param out,
+        which can be also self. Returns out."""
+        out.q[:3] = -self.q[:3]
+        out.q[3] = self.q[3]
+        out._rot = None
+        out._compositions = self._compositions
+        return out
+
+    def act(self, vector: ArrayLike, out: np.ndarray | None = None) -> np.ndarray:
+        """Rotate given vector (3,) or a block of vectors (N, 3) by this
+        transformation. Result is written into @param out if provided."""
+        v = np.asarray(vector)
+        assert v.shape[-1:] == (3,) and v.ndim <= 2
+        return np.matmul(v, self.rot.T, out=out)
+
+    def slerp(self, other: SO3Quaternion, t: float) -> SO3Quaternion:
+        """Spherical linear interpolation between self (t=0) and other (t=1) along the
+        shorter arc."""
+        q1 = self.q / np.linalg.norm(self.q)
+        q2 = other.q / np.linalg.norm(other.q)
+        d = np.dot(q1, q2)
+        if d < 0:
+            q2, d = -q2, -d
+        if d > 1.0 - 1e-9:
+            q = q1 + t * (q2 - q1)
+        else:
+            theta = np.arccos(d)
+            q = (np.sin((1 - t) * theta) * q1 + np.sin(t * theta) * q2) / np.sin(theta)
+        return SO3Quaternion(q).normalize()
+
+    def __eq__(self, other: SO3Quaternion | SO3) -> bool:
+        """Returns true if two transformations are almost equal."""
+        return np.allclose(self.rot, other.rot)
+
+    def __hash__(self):
+        return id(self)
+
+    def key(self, resolution: float = 1e-6) -> tuple[int, ...]:
+        """Return hashable key of the rotation quantized with the given resolution.
+        The key is identical to the key of the SO3 with the same rotation matrix."""
+        return quantize(self.rot, resolution)
+
+    def __repr__(self):
+        return f"SO3Quaternion(q={self.q})"
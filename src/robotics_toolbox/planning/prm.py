@@ -17,7 +17,11 @@ from scipy.sparse import csgraph
 
 from robotics_toolbox.core import SE3
 from robotics_toolbox.robots.robot_base import RobotBase
-from robotics_toolbox.utils import distance_between_configurations, interpolate
+from robotics_toolbox.utils import (
+    distance_between_configurations,
+    interpolate,
+    stack_configurations,
+)
 
 
 class GraphPlanner:
@@ -104,16 +108,11 @@ class PRM:
         q_new = q_init
         for _ in range(max_iter):
             q_new = interpolate(q_new, q_goal, self.delta_q)
-
-            # if there is collision on path return none
-            if self.robot.set_configuration(q_new).in_collision():
-                return None
-
             path.append(q_new)
 
-            # if you get close enough to goal return path
+            # if you get close enough to goal check the whole path for collision
             if distance_between_configurations(q_new, q_goal) < self.delta_q:
-                return path
+                return None if self.robot.path_in_collision(path) else path
 
         # if goal is too far away  return none (runs out of iterations)
         return None
@@ -126,22 +125,24 @@ class PRM:
         reacheble node id
         """
 
-        closest_node = None
-        shortest_path = []
-        best_path_len = -1
-        for node in self.graph:
+        if len(self.graph) == 0:
+            return [], None
+
+        # path length grows with the distance, so the nodes are tried from the closest
+        # one and the first connectable node is the closest reachable node
+        distances = distance_between_configurations(
+            q, stack_configurations([node.config for node in self.graph])
+        )
+        for i in np.argsort(distances, kind="stable"):
+            node = self.graph[i]
             if q_to_graph:
                 path = self.connect(q, node.config)
             else:
                 path = self.connect(node.config, q)
-            if path is None:
-                continue
-            elif len(path) < best_path_len or best_path_len == -1:
-                closest_node = node.id
-                shortest_path = deepcopy(path)
-                best_path_len = len(shortest_path)
-
-        return shortest_path, closest_node
+            if path is not None:
+                return deepcopy(path), node.id
+
+        return [], None
 
     def plan(
         self,
@@ -56,6 +56,7 @@ class RendererSpatial(Scene):
             self.manipulators[robot].pose = self._se3_to_meshcat_pose(robot.base_pose)
             self.manipulators[robot][:] = robot.q[:]
         else:
+            assert robot.meshcat_robot is not None, "Headless robot cannot be rendered."
             self.manipulators[robot] = robot.meshcat_robot
             self.add_robot(self.manipulators[robot])
             self.plot_manipulator(robot)
@@ -22,21 +22,24 @@ class SE2Renderer:
         self.t = t
         self.length = length
 
-        o = self.t.act(np.array([0, 0]))
-        x = self.t.act(np.array([self.length, 0]))
-        y = self.t.act(np.array([0, self.length]))
+        o, x, y = self._axes_points()
         self.data = [
             self.plot_line_between_points(o, x, "r-", *args, **kwargs)[0],
             self.plot_line_between_points(o, y, "g-", *args, **kwargs)[0],
         ]
 
     def update(self):
-        o = self.t.act(np.array([0, 0]))
-        x = self.t.act(np.array([self.length, 0]))
-        y = self.t.act(np.array([0, self.length]))
+        o, x, y = self._axes_points()
         self.data[0].set_data([o[0], x[0]], [o[1], x[1]])
         self.data[1].set_data([o[0], y[0]], [o[1], y[1]])
 
+    def _axes_points(self) -> np.ndarray:
+        """Return origin and end points of the x and y axes in the reference frame."""
+        points = np.array([[0, 0], [self.length, 0], [0, self.length]])
+        if isinstance(self.t, SE2):
+            return points @ self.t.rotation.rot.T + self.t.translation
+        return points @ self.t.rot.T
+
     def plot_line_between_points(self, a: ArrayLike, b: ArrayLike, *args, **kwargs):
         """Plot line between two given 2D points a and b. Other arguments passed to
         ax.plot function."""
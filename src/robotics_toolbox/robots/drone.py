@@ -7,11 +7,13 @@
 from __future__ import annotations
 import numpy as np
 
-from robotics_toolbox.core import SE3, SE2, SO3
+from robotics_toolbox.core import SE3, SE2, SO3, SE3Batch, SO3Batch
 from robotics_toolbox.robots.robot_base import RobotBase
 
 
 class Drone(RobotBase):
+    _vectorized_collision = True
+
     def __init__(self) -> None:
         super().__init__()
         self.pose = SE3()
@@ -24,6 +26,12 @@ class Drone(RobotBase):
             rotation=SO3.exp(np.random.uniform(0, np.pi, size=3)),
         )
 
+    def sample_configurations(self, n: int) -> SE3Batch:
+        return SE3Batch(
+            np.random.uniform(self.min_translation, self.max_translation, (n, 3)),
+            SO3Batch.exp(np.random.uniform(0, np.pi, size=(n, 3))),
+        )
+
     def set_configuration(self, configuration: np.ndarray | SE2 | SE3):
         self.pose = configuration
         return self
@@ -31,5 +39,8 @@ class Drone(RobotBase):
     def in_collision(self) -> bool:
         return False
 
+    def in_collision_batch(self, configurations: list[SE3] | SE3Batch) -> np.ndarray:
+        return np.zeros(len(configurations), dtype=bool)
+
     def configuration(self) -> np.ndarray | SE2 | SE3:
         return self.pose
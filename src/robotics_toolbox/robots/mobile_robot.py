@@ -6,13 +6,17 @@
 #
 from __future__ import annotations
 import numpy as np
-from shapely import MultiPolygon, Point, affinity
+import shapely
+from shapely import MultiPolygon, Polygon
 
-from robotics_toolbox.core import SE2, SE3, SO2
+from robotics_toolbox.core import SE2, SE3, SO2, SE2Batch
 from robotics_toolbox.robots.robot_base import RobotBase
+from robotics_toolbox.utils import SignedDistanceField, ConfigurationSpaceGrid
 
 
 class MobileRobot(RobotBase):
+    _vectorized_collision = True
+
     def __init__(self, size: float = 0.3) -> None:
         super().__init__()
         self.pose = SE2()
@@ -22,22 +26,145 @@ class MobileRobot(RobotBase):
 
         self.obstacles: MultiPolygon | None = None
 
+        # Collision checking by exact "shapely" geometry, by "sdf" lookup that
+        # falls back to the exact check close to the obstacles, or by "cspace" grid
+        # lookup that falls back to the exact check in the occupied cells
+        self.collision_backend = "shapely"
+        self.sdf_resolution = 0.01
+        self._sdf: SignedDistanceField | None = None
+        self.cspace_grid: ConfigurationSpaceGrid | None = None
+
+        # Square footprint in the robot frame, recomputed if size changes
+        self._footprint_size: float | None = None
+        self._footprint_local = np.empty((4, 2))
+
     def sample_configuration(self) -> np.ndarray | SE2 | SE3:
         return SE2(
             translation=np.random.uniform(self.min_position, self.max_position),
             rotation=SO2(angle=np.random.uniform(-np.pi, np.pi)),
         )
 
+    def sample_configurations(self, n: int) -> SE2Batch:
+        return SE2Batch(
+            np.random.uniform(self.min_position, self.max_position, size=(n, 2)),
+            np.random.uniform(-np.pi, np.pi, size=n),
+        )
+
     def set_configuration(self, configuration: np.ndarray | SE2 | SE3):
         self.pose = configuration
         return self
 
+    def _footprint_vertices(self) -> np.ndarray:
+        """Return vertices (4, 2) of the square footprint in the robot frame."""
+        if self._footprint_size != self.size:
+            self._footprint_size = self.size
+            self._footprint_local = self.size * np.array(
+                [[1.0, -1.0], [1.0, 1.0], [-1.0, 1.0], [-1.0, -1.0]]
+            )
+        return self._footprint_local
+
+    def _rotated_footprints(self, angles: np.ndarray) -> np.ndarray:
+        """Return vertices (N, 4, 2) of the footprint rotated by the angles (N,)."""
+        c, s = np.cos(angles), np.sin(angles)
+        rot_transposed = np.stack((c, s, -s, c), axis=-1).reshape(-1, 2, 2)
+        return np.matmul(self._footprint_vertices(), rot_transposed)
+
+    def footprint(self, pose: SE2 | None = None) -> Polygon:
+        """Return footprint polygon of the robot at the given pose, current pose of
+        the robot is used by default. The footprint is rotated by the angle of the
+        pose, i.e. it is axis aligned until SO2.angle is implemented."""
+        pose = self.pose if pose is None else pose
+        vertices = self._rotated_footprints(np.array([pose.rotation.angle]))[0]
+        return Polygon(vertices + pose.translation)
+
+    def signed_distance_field(self) -> SignedDistanceField:
+        """Return signed distance field of the obstacles over the positions of the
+        robot. The field is rebuilt only if obstacles, resolution or position limits
+        change."""
+        sdf = self._sdf
+        if (
+            sdf is None
+            or sdf.obstacles is not self.obstacles
+            or sdf.resolution != self.sdf_resolution
+            or not np.array_equal(sdf.lower, self.min_position)
+            or not np.array_equal(sdf.upper, self.max_position)
+        ):
+            self._sdf = SignedDistanceField(
+                self.obstacles,
+                self.min_position,
+                self.max_position,
+                self.sdf_resolution,
+            )
+        return self._sdf
+
+    def compute_cspace_grid(
+        self, resolution: float = 0.02, n_headings: int = 64
+    ) -> ConfigurationSpaceGrid:
+        """Precompute configuration space grid of the current obstacles over the
+        position limits of the robot, store it in self.cspace_grid and return it."""
+        self.cspace_grid = ConfigurationSpaceGrid.from_footprint(
+            self.obstacles,
+            self._footprint_vertices(),
+            self.min_position,
+            self.max_position,
+            resolution,
+            n_headings,
+        )
+        return self.cspace_grid
+
+    def _classification(
+        self, translations: np.ndarray, angles: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Classify poses given by translations (N, 2) and angles (N,) by the "sdf" or "cspace" backend. Returns masks of poses that are certainly in
+        collision and certainly collision free, the rest needs the exact check.
+
+        SDF decides from the distance of the center: an obstacle inside the inscribed
+        circle is a collision, no obstacle inside the circumscribed circle is free.
+        C-space grid is conservative, i.e. it decides only the free poses."""
+        if self.collision_backend == "sdf":
+            sdf = self.signed_distance_field()
+            d = sdf.value(translations)
+            collision = d + sdf.margin <= self.size
+            free = d - sdf.margin > self.size * np.sqrt(2)
+            return collision, free
+        assert self.cspace_grid is not None, "Use compute_cspace_grid or load one."
+        free = ~self.cspace_grid.occupied(translations, angles)
+        return np.zeros(len(free), dtype=bool), free
+
     def in_collision(self) -> bool:
-        geometry = Point(self.pose.translation).buffer(self.size, cap_style=3)
-        geometry = affinity.rotate(
-            geometry, np.rad2deg(self.pose.rotation.angle), "center"
+        assert self.collision_backend in ("shapely", "sdf", "cspace")
+        if self.collision_backend != "shapely":
+            collision, free = self._classification(
+                self.pose.translation[np.newaxis], np.array([self.pose.rotation.angle])
+            )
+            if collision[0] or free[0]:
+                return bool(collision[0])
+        return self.obstacle_world().intersects(self.footprint())
+
+    def in_collision_batch(self, poses: SE2Batch | list[SE2]) -> np.ndarray:
+        """Check N poses for collision, returns boolean array (N,). Internal pose of
+        the robot is not changed."""
+        assert self.collision_backend in ("shapely", "sdf", "cspace")
+        if not isinstance(poses, SE2Batch):
+            poses = SE2Batch.from_poses(poses)
+        translations, angles = poses.translation, poses.rotation.angle
+        if self.collision_backend == "shapely":
+            return self._in_collision_batch_exact(translations, angles)
+        collision, free = self._classification(translations, angles)
+        undecided = np.flatnonzero(~(collision | free))
+        collision[undecided] = self._in_collision_batch_exact(
+            translations[undecided], angles[undecided]
         )
-        return geometry.intersects(self.obstacles)
+        return collision
+
+    def _in_collision_batch_exact(
+        self, translations: np.ndarray, angles: np.ndarray
+    ) -> np.ndarray:
+        """Check N poses given by translations (N, 2) and angles (N,) by the footprint
+        polygons, returns boolean array (N,)."""
+        vertices = self._rotated_footprints(angles)
+        vertices += translations[:, np.newaxis]
+        return self.obstacle_world().intersects_batch(shapely.polygons(vertices))
 
     def configuration(self) -> np.ndarray | SE2 | SE3:
         return self.pose
@@ -10,13 +10,16 @@
 from __future__ import annotations
 import numpy as np
 from numpy.typing import ArrayLike
-from shapely import MultiPolygon, LineString, MultiLineString
+from shapely import MultiPolygon
 
 from robotics_toolbox.core import SE2, SE3
 from robotics_toolbox.robots.robot_base import RobotBase
+from robotics_toolbox.utils import segments_intersect, ray_crosses_segment
 
 
 class PlanarManipulator(RobotBase):
+    _vectorized_collision = True
+
     def __init__(
         self,
         link_parameters: ArrayLike | None = None,
@@ -65,6 +68,12 @@ class PlanarManipulator(RobotBase):
         # Additional obstacles for collision checking function
         self.obstacles: MultiPolygon | None = None
 
+        # Cache of link frames for the last configuration, see _link_frames
+        self._fk_key: tuple | None = None
+        self._fk_q = np.empty(0)
+        self._fk_origins = np.empty((0, 2))
+        self._fk_angles = np.empty(0)
+
     @property
     def dof(self):
         """Return number of degrees of freedom."""
@@ -75,6 +84,10 @@ class PlanarManipulator(RobotBase):
         internal state."""
         return np.random.uniform(self.q_min, self.q_max)
 
+    def sample_configurations(self, n: int) -> np.ndarray:
+        """Sample n configurations (n, dof) inside the configuration space."""
+        return np.random.uniform(self.q_min, self.q_max, size=(n, len(self.q_min)))
+
     def set_configuration(self, configuration: np.ndarray | SE2 | SE3):
         """Set configuration of the robot, return self for chaining."""
         self.q = configuration
@@ -97,24 +110,93 @@ class PlanarManipulator(RobotBase):
         frames = []
         return frames
 
+    def fk_batch(self, configurations: ArrayLike) -> tuple[np.ndarray, np.ndarray]:
+        """Compute FK of all link frames for N configurations at once.
+
+        Args:
+            configurations: array of shape (N, dof)
+
+        Returns:
+            origins of the frames (N, dof+1, 2) and their angles (N, dof+1); the first
+            frame is the base frame and the last one is the flange frame.
+        """
+        q = np.asarray(configurations, dtype=float)
+        assert q.ndim == 2 and q.shape[1] == len(self.link_parameters)
+        revolute = np.asarray([s == "R" for s in self.structure])
+        lp = self.link_parameters
+        phi = np.where(revolute, q, lp)
+        d = np.where(revolute, lp, q)
+
+        base = self.base_pose
+        base_angle = np.arctan2(base.rotation.rot[1, 0], base.rotation.rot[0, 0])
+        angles = np.empty((q.shape[0], q.shape[1] + 1))
+        angles[:, 0] = base_angle
+        np.cumsum(phi, axis=1, out=angles[:, 1:])
+        angles[:, 1:] += base_angle
+
+        origins = np.empty((q.shape[0], q.shape[1] + 1, 2))
+        origins[:, 0] = base.translation
+        steps = np.stack(
+            (d * np.cos(angles[:, 1:]), d * np.sin(angles[:, 1:])), axis=-1
+        )
+        np.cumsum(steps, axis=1, out=origins[:, 1:])
+        origins[:, 1:] += base.translation
+        return origins, angles
+
+    def _link_frames(self) -> tuple[np.ndarray, np.ndarray]:
+        """Return origins (dof+1, 2) and angles (dof+1,) of all link frames for the
+        current configuration, the first frame is the base frame. Frames are cached
+        and only the frames after the first joint that changed since the last call are
+        recomputed. The cache is invalidated if base pose, link parameters or
+        structure change. Returned arrays are the cache, they must not be modified."""
+        q = np.asarray(self.q, dtype=float)
+        base = self.base_pose
+        key = (
+            tuple(self.structure),
+            self.link_parameters.tobytes(),
+            base.translation.tobytes(),
+            base.rotation.rot.tobytes(),
+        )
+        if key != self._fk_key or q.shape != self._fk_q.shape:
+            self._fk_key = key
+            self._fk_origins = np.empty((len(q) + 1, 2))
+            self._fk_angles = np.empty(len(q) + 1)
+            self._fk_origins[0] = base.translation
+            self._fk_angles[0] = np.arctan2(
+                base.rotation.rot[1, 0], base.rotation.rot[0, 0]
+            )
+            first = 0
+        else:
+            changed = np.flatnonzero(q != self._fk_q)
+            if len(changed) == 0:
+                return self._fk_origins, self._fk_angles
+            first = changed[0]
+        self._fk_q = q.copy()
+
+        origins, angles = self._fk_origins, self._fk_angles
+        for i in range(first, len(q)):
+            revolute = self.structure[i] == "R"
+            phi = q[i] if revolute else self.link_parameters[i]
+            d = self.link_parameters[i] if revolute else q[i]
+            angles[i + 1] = angles[i] + phi
+            origins[i + 1, 0] = origins[i, 0] + d * np.cos(angles[i + 1])
+            origins[i + 1, 1] = origins[i, 1] + d * np.sin(angles[i + 1])
+        return origins, angles
+
     def _gripper_lines(self, flange: SE2):
         """Return tuple of lines (start-end point) that are used to plot gripper
         attached to the flange frame."""
         gripper_opening = self.gripper_opening / 2.0
-        return (
-            (
-                (flange * SE2([0, -gripper_opening])).translation,
-                (flange * SE2([0, +gripper_opening])).translation,
-            ),
-            (
-                (flange * SE2([0, -gripper_opening])).translation,
-                (flange * SE2([self.gripper_length, -gripper_opening])).translation,
-            ),
-            (
-                (flange * SE2([0, +gripper_opening])).translation,
-                (flange * SE2([self.gripper_length, +gripper_opening])).translation,
-            ),
+        points = np.array(
+            [
+                [0, -gripper_opening],
+                [0, +gripper_opening],
+                [self.gripper_length, -gripper_opening],
+                [self.gripper_length, +gripper_opening],
+            ]
         )
+        a, b, c, d = points @ flange.rotation.rot.T + flange.translation
+        return (a, b), (a, c), (b, d)
 
     def jacobian(self) -> np.ndarray:
         """Computes jacobian of the manipulator for the given structure and
@@ -140,6 +222,66 @@ class PlanarManipulator(RobotBase):
 
         return False
 
+    def ik_numerical_batch(
+        self,
+        flange_pose_desired: SE2,
+        n_seeds: int = 32,
+        max_iterations: int = 20,
+        acceptable_err: float = 1e-4,
+        damping: float = 1e-2,
+    ) -> list[np.ndarray]:
+        """Compute IK numerically from the current configuration and n_seeds - 1
+        random configurations at once by damped least squares. Returns all converged
+        solutions within the joint limits, without duplicates, sorted by the distance
+        from self.q. Revolute joints of the solutions are in [-pi, pi)."""
+        revolute = np.asarray([s == "R" for s in self.structure])
+        rot = flange_pose_desired.rotation.rot
+        target_angle = np.arctan2(rot[1, 0], rot[0, 0])
+        target_origin = flange_pose_desired.translation
+
+        q = np.vstack((self.q, self.sample_configurations(n_seeds - 1)))
+        converged = np.zeros(len(q), dtype=bool)
+        active = np.arange(len(q))
+        damping = damping**2 * np.eye(3)
+        # error is evaluated once more after the last step
+        for i in range(max_iterations + 1):
+            origins, angles = self.fk_batch(q[active])
+            err = np.empty((len(active), 3))
+            err[:, :2] = target_origin - origins[:, -1]
+            err[:, 2] = (target_angle - angles[:, -1] + np.pi) % (2 * np.pi) - np.pi
+            done = np.einsum("ni,ni->n", err, err) < acceptable_err**2
+            if np.any(done):
+                converged[active[done]] = True
+                active, origins, angles, err = (
+                    a[~done] for a in (active, origins, angles, err)
+                )
+            if len(active) == 0 or i == max_iterations:
+                break
+
+            # revolute joint rotates the flange around the origin of its frame,
+            # prismatic joint translates it along the direction of its link
+            r = origins[:, -1:] - origins[:, :-1]
+            jac = np.empty((len(active), 3, self.dof))
+            jac[:, 0] = np.where(revolute, -r[..., 1], np.cos(angles[:, 1:]))
+            jac[:, 1] = np.where(revolute, r[..., 0], np.sin(angles[:, 1:]))
+            jac[:, 2] = revolute
+            jac_t = jac.transpose(0, 2, 1)
+            dq = jac_t @ np.linalg.solve(jac @ jac_t + damping, err[..., np.newaxis])
+            q[active] += dq[..., 0]
+
+        q = q[converged]
+        q[:, revolute] = (q[:, revolute] + np.pi) % (2 * np.pi) - np.pi
+        q = q[np.all((q >= self.q_min) & (q <= self.q_max), axis=-1)]
+        diff = q - self.q
+        diff[:, revolute] = (diff[:, revolute] + np.pi) % (2 * np.pi) - np.pi
+        q = q[np.argsort(np.linalg.norm(diff, axis=-1), kind="stable")]
+
+        # solution is a duplicate if it is close to a solution closer to self.q
+        diff = q[:, np.newaxis] - q[np.newaxis]
+        diff[..., revolute] = (diff[..., revolute] + np.pi) % (2 * np.pi) - np.pi
+        close = np.tril(np.linalg.norm(diff, axis=-1) < np.sqrt(acceptable_err), k=-1)
+        return list(q[~np.any(close, axis=-1)])
+
     def ik_analytical(self, flange_pose_desired: SE2) -> list[np.ndarray]:
         """Compute IK analytically, return all solutions for joint limits being
         from -pi to pi for revolute joints -inf to inf for prismatic joints."""
@@ -154,18 +296,83 @@ class PlanarManipulator(RobotBase):
             pass
         return []
 
+    def _collision_segments(
+        self, origins: np.ndarray, angles: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Return start and end points (N, dof+3, 2) of segments used for collision
+        checking computed from the link frames (N, dof+1, 2) and (N, dof+1). Segments
+        are the links followed by the three gripper lines, see _gripper_lines."""
+        flange, angle = origins[:, -1], angles[:, -1]
+        ex = np.stack((np.cos(angle), np.sin(angle)), axis=-1)
+        ey = np.stack((-ex[:, 1], ex[:, 0]), axis=-1)
+        a = flange - self.gripper_opening / 2.0 * ey
+        b = flange + self.gripper_opening / 2.0 * ey
+        c = a + self.gripper_length * ex
+        d = b + self.gripper_length * ex
+        starts = np.concatenate((origins[:, :-1], np.stack((a, a, b), axis=1)), axis=1)
+        ends = np.concatenate((origins[:, 1:], np.stack((b, c, d), axis=1)), axis=1)
+        return starts, ends
+
+    def _self_collision_pairs(self) -> tuple[np.ndarray, np.ndarray]:
+        """Return indices of segments that are checked for self-collision. The last
+        link and gripper are considered as a single body and only bodies that are not
+        adjacent are checked."""
+        n = self.dof
+        body = np.minimum(np.arange(n + 3), n - 1)
+        i, j = np.triu_indices(n + 3, k=1)
+        mask = body[j] >= body[i] + 2
+        return i[mask], j[mask]
+
+    def _segments_in_collision(
+        self, starts: np.ndarray, ends: np.ndarray
+    ) -> np.ndarray:
+        """Check segments (N, dof+3, 2) for self-collision and collision with the
+        obstacles. Returns boolean array (N,)."""
+        i, j = self._self_collision_pairs()
+        collision = np.any(
+            segments_intersect(starts[:, i], ends[:, i], starts[:, j], ends[:, j]),
+            axis=-1,
+        )
+        world = self.obstacle_world()
+        if len(world) == 0:
+            return collision
+        # only edges of polygons overlapping the bounding box of a segment are tested
+        s0, s1 = starts.reshape(-1, 2), ends.reshape(-1, 2)
+        k, e = world.candidate_edges(
+            np.hstack((np.minimum(s0, s1), np.maximum(s0, s1)))
+        )
+        hits = segments_intersect(
+            s0[k], s1[k], world.edges_start[e], world.edges_end[e]
+        )
+        collision[k[hits] // starts.shape[1]] = True
+        # without edge crossing the connected segments are either inside or outside
+        p = starts[:, 0]
+        k, e = world.candidate_edges(np.hstack((p, p)))
+        crossings = ray_crosses_segment(p[k], world.edges_start[e], world.edges_end[e])
+        # parity is counted per polygon, members of the obstacles may overlap
+        keys, index = np.unique(
+            k * len(world) + world.edges_polygon[e], return_inverse=True
+        )
+        inside = np.bincount(index.reshape(-1), crossings, minlength=len(keys)) % 2 == 1
+        collision[keys[inside] // len(world)] = True
+        return collision
+
     def in_collision(self) -> bool:
         """Check if robot in its current pose is in collision."""
-        frames = self.fk_all_links()
-        points = [f.translation for f in frames]
-        gripper_lines = self._gripper_lines(frames[-1])
-
-        links = [LineString([a, b]) for a, b in zip(points[:-2], points[1:-1])]
-        links += [MultiLineString((*gripper_lines, (points[-2], points[-1])))]
-        for i in range(len(links)):
-            for j in range(i + 2, len(links)):
-                if links[i].intersects(links[j]):
-                    return True
-        return MultiLineString(
-            (*gripper_lines, *zip(points[:-1], points[1:]))
-        ).intersects(self.obstacles)
+        origins, angles = self._link_frames()
+        starts, ends = self._collision_segments(origins[np.newaxis], angles[np.newaxis])
+        return bool(self._segments_in_collision(starts, ends)[0])
+
+    def in_collision_batch(self, configurations: ArrayLike) -> np.ndarray:
+        """Check N configurations (N, dof) for collision, returns boolean array (N,).
+        Internal configuration of the robot is not changed."""
+        origins, angles = self.fk_batch(configurations)
+        starts, ends = self._collision_segments(origins, angles)
+        chunk = 4096
+        return np.concatenate(
+            [
+                self._segments_in_collision(starts[k : k + chunk], ends[k : k + chunk])
+                for k in range(0, len(starts), chunk)
+            ]
+            + [np.zeros(0, dtype=bool)]
+        )
@@ -8,10 +8,106 @@ from __future__ import annotations
 from abc import abstractmethod
 import numpy as np
 
-from robotics_toolbox.core import SE2, SE3
+from robotics_toolbox.core import SE2, SE3, SE2Batch, SE3Batch
+from robotics_toolbox.utils import (
+    CollisionCache,
+    ObstacleWorld,
+    bisection_order,
+    discretize,
+    stack_configurations,
+)
 
 
 class RobotBase:
+    # True if in_collision_batch evaluates all configurations at once, i.e. checking
+    # the whole path in one call is cheaper than the early exit of the serial check
+    _vectorized_collision = False
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._obstacle_world: ObstacleWorld | None = None
+        self.collision_cache: CollisionCache | None = None
+
+    def obstacle_world(self) -> ObstacleWorld:
+        """Return obstacles of the robot prepared for collision queries. The world is
+        rebuilt only if self.obstacles is replaced by a different object."""
+        obstacles = getattr(self, "obstacles", None)
+        if (
+            self._obstacle_world is None
+            or self._obstacle_world.obstacles is not obstacles
+        ):
+            self._obstacle_world = ObstacleWorld(obstacles)
+        return self._obstacle_world
+
+    def enable_collision_cache(
+        self, maxsize: int = 100000, resolution: float = 1e-6
+    ) -> CollisionCache:
+        """Memoize results of in_collision and in_collision_batch for configurations
+        quantized with the given resolution. The cache is cleared if obstacles are
+        replaced or base_pose changes; other changes of the robot or of the obstacles
+        in place require collision_cache.clear(). Returns the cache."""
+        self.collision_cache = CollisionCache(maxsize, resolution)
+        # instance attributes take precedence over the methods of the robot class
+        self.in_collision = self._cached_in_collision
+        self.in_collision_batch = self._cached_in_collision_batch
+        return self.collision_cache
+
+    def disable_collision_cache(self):
+        """Remove the cache created by enable_collision_cache."""
+        self.collision_cache = None
+        self.__dict__.pop("in_collision", None)
+        self.__dict__.pop("in_collision_batch", None)
+
+    def _valid_collision_cache(self) -> CollisionCache:
+        """Return the collision cache cleared if obstacles or base pose changed."""
+        cache = self.collision_cache
+        base_pose = getattr(self, "base_pose", None)
+        context = (
+            getattr(self, "obstacles", None),
+            None if base_pose is None else base_pose.key(cache.resolution),
+        )
+        if (
+            cache.context is None
+            or cache.context[0] is not context[0]
+            or cache.context[1] != context[1]
+        ):
+            cache.clear()
+            cache.context = context
+        return cache
+
+    def _cached_in_collision(self) -> bool:
+        cache = self._valid_collision_cache()
+        key = cache.key(self.configuration())
+        result = cache.get(key)
+        if result is None:
+            result = type(self).in_collision(self)
+            cache.put(key, result)
+        return result
+
+    def _cached_in_collision_batch(
+        self, configurations: list | np.ndarray | SE2Batch | SE3Batch, **kwargs
+    ) -> np.ndarray:
+        if type(self).in_collision_batch is RobotBase.in_collision_batch:
+            # default implementation calls the cached in_collision
+            return RobotBase.in_collision_batch(self, configurations)
+        if len(configurations) == 0:
+            return np.zeros(0, dtype=bool)
+        if isinstance(configurations, list):
+            configurations = stack_configurations(configurations)
+        cache = self._valid_collision_cache()
+        keys = cache.keys(configurations)
+        results = [cache.get(key) for key in keys]
+        missing = [i for i, result in enumerate(results) if result is None]
+        out = np.asarray([bool(result) for result in results], dtype=bool)
+        if len(missing) > 0:
+            computed = type(self).in_collision_batch(
+                self, configurations[np.asarray(missing)], **kwargs
+            )
+            out[missing] = computed
+            for i, result in zip(missing, computed):
+                cache.put(keys[i], result)
+        return out
+
     @abstractmethod
     def sample_configuration(self) -> np.ndarray | SE2 | SE3:
         """Sample robot configuration inside the configuration space."""
@@ -31,3 +127,52 @@ class RobotBase:
     def in_collision(self) -> bool:
         """Check if robot is in collision."""
         pass
+
+    def sample_configurations(self, n: int) -> np.ndarray | SE2Batch | SE3Batch:
+        """Sample n configurations, returns (n, dof) array or SE2Batch/SE3Batch."""
+        return stack_configurations([self.sample_configuration() for _ in range(n)])
+
+    def in_collision_batch(
+        self, configurations: list | np.ndarray | SE2Batch | SE3Batch
+    ) -> np.ndarray:
+        """Check N configurations for collision, returns boolean array (N,). Internal
+        configuration of the robot is not changed. The default implementation loops
+        over in_collision; robots override it by a vectorized version."""
+        current = self.configuration()
+        try:
+            return np.asarray(
+                [self.set_configuration(q).in_collision() for q in configurations],
+                dtype=bool,
+            ).reshape(-1)
+        finally:
+            self.set_configuration(current)
+
+    def path_in_collision(
+        self,
+        configurations: list[np.ndarray | SE2 | SE3] | np.ndarray | SE2Batch | SE3Batch,
+    ) -> bool:
+        """Check if any of the configurations is in collision. Robots with vectorized
+        in_collision_batch check all configurations at once, otherwise configurations
+        are checked one by one in bisection order until the first collision. Internal
+        configuration of the robot may be changed."""
+        if len(configurations) == 0:
+            return False
+        if self._vectorized_collision:
+            if isinstance(configurations, list):
+                configurations = stack_configurations(configurations)
+            return bool(np.any(self.in_collision_batch(configurations)))
+        for i in bisection_order(len(configurations)):
+            if self.set_configuration(configurations[i]).in_collision():
+                return True
+        return False
+
+    def segment_in_collision(
+        self,
+        q_a: np.ndarray | SE2 | SE3,
+        q_b: np.ndarray | SE2 | SE3,
+        resolution: float,
+    ) -> bool:
+        """Check if the straight segment between two configurations is in collision.
+        The segment is discretized with the given resolution, q_a is not checked
+        as it is assumed to be checked already. See path_in_collision."""
+        return self.path_in_collision(discretize(q_a, q_b, resolution))
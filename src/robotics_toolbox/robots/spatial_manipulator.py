@@ -5,12 +5,14 @@
 #     Author: Vladimir Petrik <vladimir.petrik@cvut.cz>
 #
 from __future__ import annotations
+import hashlib
+import os
+import threading
 from pathlib import Path
-from robomeshcat import Robot
 import numpy as np
 import pinocchio as pin
 
-from robotics_toolbox.core import SE3, SO3, SE2
+from robotics_toolbox.core import SE3, SE2
 from robotics_toolbox.robots.robot_base import RobotBase
 
 
@@ -22,6 +24,8 @@ class SpatialManipulator(RobotBase):
         mesh_folder_path: Path | str | list[Path] | list[str] | None = None,
         srdf_path: Path | str | None = None,
         base_pose: SE3 | None = None,
+        headless: bool = False,
+        cache_dir: Path | str | None = None,
         **kwargs,
     ) -> None:
         """
@@ -29,6 +33,10 @@ class SpatialManipulator(RobotBase):
         robot_name: needs to be from the list: None, Panda, Talos, Tiago
         urdf_path and mesh_folder_path needs to be specified in robot_name is None
         srdf_path: path to srdf that disable collisions
+        headless: if true, robomeshcat is not imported and the visual model is not
+         created, i.e. the robot cannot be rendered; kwargs are passed to robomeshcat
+        cache_dir: directory used to cache the parsed models with filtered collision
+         pairs, keyed by the content of URDF and SRDF; no caching if None
         """
         super().__init__()
         self.robot_name = robot_name
@@ -46,48 +54,83 @@ class SpatialManipulator(RobotBase):
             mesh_folder_path = Path(RLoader().model_path).parent.parent
             srdf_path = RLoader().srdf_path
 
-        self.meshcat_robot = Robot(
-            urdf_path=urdf_path, mesh_folder_path=mesh_folder_path, **kwargs
-        )
+        if mesh_folder_path is None:
+            mesh_folder_path = Path(urdf_path).parent
+        if isinstance(mesh_folder_path, list):
+            mesh_folder_path = [str(p) for p in mesh_folder_path]
+        else:
+            mesh_folder_path = str(mesh_folder_path)
 
-        (
-            self._model,
-            self._data,
-            self._geom_model,
-            self._geom_data,
-        ) = self.meshcat_robot._build_model_from_urdf(urdf_path, mesh_folder_path, True)
-        self._geom_model.addAllCollisionPairs()
-        if srdf_path is not None:
-            pin.removeCollisionPairs(self._model, self._geom_model, srdf_path)
+        self.meshcat_robot = None
+        if not headless:
+            from robomeshcat import Robot
+
+            self.meshcat_robot = Robot(
+                urdf_path=urdf_path, mesh_folder_path=mesh_folder_path, **kwargs
+            )
+
+        self._model, self._geom_model = _load_models(
+            urdf_path, mesh_folder_path, srdf_path, cache_dir
+        )
+        self._data = self._model.createData()
         self._geom_data = self._geom_model.createData()
+        # data used by the stateless evaluation, created lazily for each thread
+        self._thread_local = threading.local()
+        # number of recently colliding pairs checked before the broad phase so that
+        # typical colliding configurations are rejected early
+        self.n_hot_collision_pairs = 4
 
         self.base_pose = base_pose if base_pose is not None else SE3()
-        self.q = np.zeros(len(self.meshcat_robot._q))
+        self.q = np.zeros(self._model.nq)
 
     @property
     def dof(self) -> int:
         """Return number of degrees of freedom for the robot."""
-        return len(self.meshcat_robot._q)
+        return self._model.nq
 
     def flange_pose(self, flange_link_name: str | None = None) -> SE3:
         """Return a flange pose defined by the link name. Flange link name can be
         empty for Panda robot."""
+        return self.flange_pose_at(self.q, flange_link_name)
+
+    def flange_pose_at(self, q: np.ndarray, flange_link_name: str | None = None) -> SE3:
+        """Return a flange pose for the given configuration. Internal state of the
+        robot is not changed and the method can be called from multiple threads."""
         flange_link_name = self._resolve_flange_link_name(flange_link_name)
-        self.meshcat_robot[:] = self.q
-        pin.updateFramePlacements(self._model, self._data)
+        data, _ = self._thread_data()
         frame_id = self._model.getFrameId(flange_link_name)
-        m = self._data.oMf[frame_id].homogeneous
-        return SE3(m[:3, 3], SO3(rotation_matrix=m[:3, :3]))
+        pin.forwardKinematics(self._model, data, np.asarray(q, dtype=float))
+        m = pin.updateFramePlacement(self._model, data, frame_id).homogeneous
+        return SE3.from_arrays_unchecked(m[:3, 3], m[:3, :3])
+
+    def _thread_data(self) -> tuple[pin.Data, pin.GeometryData]:
+        """Return model and geometry data owned by the calling thread."""
+        local = self._thread_local
+        if not hasattr(local, "data"):
+            local.data = self._model.createData()
+            local.geom_data = self._geom_model.createData()
+            # broad phase over AABBs of the geometries, pairs of geometries with
+            # overlapping AABBs are passed to the narrow phase
+            local.broad_phase = pin.BroadPhaseManager_DynamicAABBTreeCollisionManager(
+                self._model, self._geom_model, local.geom_data
+            )
+            local.callback = pin.CollisionCallBackDefault(
+                self._geom_model, local.geom_data, True
+            )
+            # recently colliding pairs, the most recent first
+            local.hot_pairs = []
+        return local.data, local.geom_data
 
     def jacobian(self, flange_link_name: str | None = None) -> np.ndarray:
         """Computes jacobian of the manipulator for the given structure and
         configuration."""
         flange_link_name = self._resolve_flange_link_name(flange_link_name)
         fid = self._model.getFrameId(flange_link_name)
+        data, _ = self._thread_data()
         return pin.computeFrameJacobian(
             self._model,
-            self._data,
-            self.q,
+            data,
+            np.asarray(self.q, dtype=float),
             fid,
             pin.ReferenceFrame.LOCAL_WORLD_ALIGNED,
         )
@@ -107,19 +150,121 @@ class SpatialManipulator(RobotBase):
     def sample_configuration(self) -> np.ndarray | SE2 | SE3:
         return pin.randomConfiguration(self._model)
 
+    def sample_configurations(self, n: int) -> np.ndarray:
+        lower = self._model.lowerPositionLimit
+        upper = self._model.upperPositionLimit
+        if self._model.nq != self._model.nv or not np.all(np.isfinite(upper - lower)):
+            return super().sample_configurations(n)
+        return np.random.uniform(lower, upper, size=(n, self._model.nq))
+
     def set_configuration(self, configuration: np.ndarray | SE2 | SE3):
         self.q = configuration
         return self
 
     def in_collision(self) -> bool:
-        return pin.computeCollisions(
-            self._model,
-            self._data,
-            self._geom_model,
-            self._geom_data,
-            self.configuration(),
-            True,
+        return self.in_collision_at(self.configuration())
+
+    def in_collision_at(self, q: np.ndarray) -> bool:
+        """Check if the given configuration is in collision. Internal state of the
+        robot is not changed and the method can be called from multiple threads.
+        Pairs that collided recently in the calling thread are checked first, the
+        remaining pairs are filtered by the broad phase."""
+        data, geom_data = self._thread_data()
+        pin.updateGeometryPlacements(
+            self._model, data, self._geom_model, geom_data, np.asarray(q, dtype=float)
+        )
+        local = self._thread_local
+        for k in local.hot_pairs:
+            if pin.computeCollision(self._geom_model, geom_data, k):
+                self._record_collision_pair(k)
+                return True
+
+        local.broad_phase.update(False)
+        local.callback.init()
+        if pin.computeCollisions(local.broad_phase, local.callback):
+            self._record_collision_pair(local.callback.collisionPairIndex)
+            return True
+        return False
+
+    def _record_collision_pair(self, pair_index: int):
+        """Move the colliding pair to the front of the pairs checked before the broad
+        phase by the calling thread."""
+        hot = self._thread_local.hot_pairs
+        if pair_index in hot:
+            hot.remove(pair_index)
+        hot.insert(0, int(pair_index))
+        del hot[self.n_hot_collision_pairs :]
+
+    def in_collision_batch(
+        self, configurations: np.ndarray, max_workers: int | None = None
+    ) -> np.ndarray:
+        """Check N configurations (N, dof) for collision, returns boolean array (N,).
+        The whole batch is evaluated by pinocchio with the broad phase, in parallel
+        by @param max_workers OpenMP threads, number of CPUs by default. Internal
+        configuration of the robot is not changed and the method can be called from
+        multiple threads."""
+        q = np.asarray(configurations, dtype=float).reshape(-1, self._model.nq)
+        if len(q) == 0:
+            return np.zeros(0, dtype=bool)
+        workers = min(max_workers or os.cpu_count() or 1, len(q))
+        pool = getattr(self._thread_local, "collision_pool", None)
+        if pool is None or pool.size() < workers:
+            # models and data are copied for each thread of the pool
+            pool = pin.BroadPhaseManagerPool_DynamicAABBTreeCollisionManager(
+                self._model, self._geom_model, workers
+            )
+            self._thread_local.collision_pool = pool
+        out = pin.computeCollisionsInParallel(
+            workers, pool, np.asfortranarray(q.T), True
         )
+        return np.asarray(out, dtype=bool)
 
     def configuration(self) -> np.ndarray | SE2 | SE3:
         return self.q
+
+
+def _load_models(
+    urdf_path: Path | str,
+    mesh_folder_path: str | list[str],
+    srdf_path: Path | str | None,
+    cache_dir: Path | str | None,
+) -> tuple[pin.Model, pin.GeometryModel]:
+    """Load kinematic model and collision model with all collision pairs except those
+    disabled by SRDF. If cache_dir is given, models are stored there by pinocchio
+    serialization, keyed by the hash of URDF/SRDF content, mesh folder and pinocchio
+    version, and loaded from there on the next call. Unreadable cache files are
+    overwritten."""
+    if cache_dir is not None:
+        h = hashlib.sha256()
+        h.update(Path(urdf_path).read_bytes())
+        if srdf_path is not None:
+            h.update(Path(srdf_path).read_bytes())
+        h.update(str(mesh_folder_path).encode())
+        h.update(pin.__version__.encode())
+        prefix = Path(cache_dir).joinpath(h.hexdigest())
+        model_path = prefix.with_suffix(".model.bin")
+        geom_path = prefix.with_suffix(".geometry.bin")
+        if model_path.exists() and geom_path.exists():
+            model, geom_model = pin.Model(), pin.GeometryModel()
+            try:
+                model.loadFromBinary(str(model_path))
+                geom_model.loadFromBinary(str(geom_path))
+                return model, geom_model
+            except RuntimeError:
+                pass  # corrupted cache is replaced by the parsed models
+
+    model, geom_model = pin.buildModelsFromUrdf(
+        str(urdf_path), mesh_folder_path, geometry_types=pin.GeometryType.COLLISION
+    )
+    geom_model.addAllCollisionPairs()
+    if srdf_path is not None:
+        pin.removeCollisionPairs(model, geom_model, str(srdf_path))
+
+    if cache_dir is not None:
+        # write into temporary files first as other processes can read the cache
+        Path(cache_dir).mkdir(parents=True, exist_ok=True)
+        for obj, path in ((model, model_path), (geom_model, geom_path)):
+            tmp = path.with_suffix(f".{os.getpid()}.tmp")
+            obj.saveToBinary(str(tmp))
+            os.replace(tmp, path)
+    return model, geom_model
@@ -5,8 +5,21 @@ from .geometry_utils import (
     nullspace,
     circle_circle_intersection,
     circle_line_intersection,
+    segments_intersect,
+    ray_crosses_segment,
+    polygon_edges,
 )
-from .configuration_utils import interpolate, distance_between_configurations
+from .configuration_utils import (
+    interpolate,
+    distance_between_configurations,
+    discretize,
+    stack_configurations,
+    bisection_order,
+)
+from .obstacle_world import ObstacleWorld
+from .signed_distance_field import SignedDistanceField
+from .cspace_grid import ConfigurationSpaceGrid
+from .collision_cache import CollisionCache
 
 __all__ = [
     "save_fig",
@@ -15,6 +28,16 @@ __all__ = [
     "nullspace",
     "circle_circle_intersection",
     "circle_line_intersection",
+    "segments_intersect",
+    "ray_crosses_segment",
+    "polygon_edges",
     "interpolate",
     "distance_between_configurations",
+    "discretize",
+    "stack_configurations",
+    "bisection_order",
+    "ObstacleWorld",
+    "SignedDistanceField",
+    "ConfigurationSpaceGrid",
+    "CollisionCache",
 ]
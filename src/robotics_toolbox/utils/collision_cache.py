@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+#
+# Copyright (c) CTU -- All Rights Reserved
+# Created on: 2026-10-18
+#
+
+"""Module for memoization of collision checks of robot configurations."""
+
+from __future__ import annotations
+from collections import OrderedDict
+import numpy as np
+
+from robotics_toolbox.core import SE2, SE3, SE2Batch, SE3Batch
+from robotics_toolbox.core.pose_key import quantize
+
+
+class CollisionCache:
+    def __init__(self, maxsize: int = 100000, resolution: float = 1e-6) -> None:
+        """Least recently used cache of collision results keyed by configurations
+        quantized with the given resolution. At most maxsize results are stored.
+        The cache does not know what the results depend on; the owner stores it in
+        self.context and clears the cache if the context changes."""
+        super().__init__()
+        self.maxsize = maxsize
+        self.resolution = resolution
+        self.context = None
+        self.hits = 0
+        self.misses = 0
+        self._results: OrderedDict[tuple[int, ...], bool] = OrderedDict()
+
+    def __len__(self) -> int:
+        """Number of stored results."""
+        return len(self._results)
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups that were answered from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups > 0 else 0.0
+
+    def key(self, configuration: np.ndarray | SE2 | SE3) -> tuple[int, ...]:
+        """Return key of a single configuration, i.e. joint array or pose."""
+        if isinstance(configuration, (SE2, SE3)):
+            return configuration.key(self.resolution)
+        return quantize(configuration, self.resolution)
+
+    def keys(
+        self, configurations: list | np.ndarray | SE2Batch | SE3Batch
+    ) -> list[tuple[int, ...]]:
+        """Return keys of N configurations; equal to the keys of the individual
+        configurations."""
+        if isinstance(configurations, (SE2Batch, SE3Batch)):
+            rot = configurations.rotation.rot
+            # SE2 key uses the first column of the rotation only
+            rot = rot[..., 0] if rot.shape[-1] == 2 else rot.reshape(len(rot), -1)
+            values = np.concatenate((configurations.translation, rot), axis=-1)
+        elif isinstance(configurations, np.ndarray):
+            values = configurations.reshape(len(configurations), -1)
+        else:
+            return [self.key(c) for c in configurations]
+        values = np.rint(values / self.resolution).astype(np.int64)
+        return list(map(tuple, values.tolist()))
+
+    def get(self, key: tuple[int, ...]) -> bool | None:
+        """Return stored result for the key or None if it is not stored."""
+        result = self._results.get(key)
+        if result is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._results.move_to_end(key)
+        return result
+
+    def put(self, key: tuple[int, ...], result: bool):
+        """Store the result, the least recently used one is evicted if full."""
+        self._results[key] = bool(result)
+        self._results.move_to_end(key)
+        if len(self._results) > self.maxsize:
+            self._results.popitem(last=False)
+
+    def clear(self):
+        """Remove all stored results, statistics are kept."""
+        self._results.clear()
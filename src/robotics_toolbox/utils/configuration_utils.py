@@ -5,17 +5,25 @@
 #     Author: Vladimir Petrik <vladimir.petrik@cvut.cz>
 #
 from __future__ import annotations
+from collections import deque
 import numpy as np
 from numpy.typing import ArrayLike
 
-from robotics_toolbox.core import SE2, SE3, SO3
+from robotics_toolbox.core import SE2, SE3, SO3, SE2Batch, SE3Batch, SO3Batch
 
 
 def distance_between_configurations(
-    a: ArrayLike | SE2 | SE3, b: ArrayLike | SE2 | SE3
-) -> float:
+    a: ArrayLike | SE2 | SE3 | SE2Batch | SE3Batch,
+    b: ArrayLike | SE2 | SE3 | SE2Batch | SE3Batch,
+) -> float | np.ndarray:
     """Compute distance between two configurations, expressed either in task-space
-    SE2/SE3 or joint space np.ndarray"""
+    SE2/SE3 or joint space np.ndarray. Any of the arguments can be also a batch of
+    configurations, i.e. (N, dof) array or SE2Batch/SE3Batch. Distances (N,) between
+    the single configuration and all configurations of the batch are returned in that
+    case. If both arguments are batches, (M, N) matrix of all pairwise distances is
+    returned."""
+    if isinstance(a, (SE2Batch, SE3Batch)) or isinstance(b, (SE2Batch, SE3Batch)):
+        return _distance_between_poses_batch(a, b)
     assert isinstance(a, type(b))
     if isinstance(a, SE2):
         d = a.inverse() * b
@@ -24,7 +32,47 @@ def distance_between_configurations(
         d = a.inverse() * b
         return np.linalg.norm(np.append(d.translation, d.rotation.log()))
     else:
-        return np.linalg.norm(a - b)
+        a, b = np.asarray(a), np.asarray(b)
+        if a.ndim == 2 and b.ndim == 2:
+            return np.linalg.norm(a[:, np.newaxis] - b[np.newaxis], axis=-1)
+        return np.linalg.norm(a - b, axis=-1)
+
+
+def _distance_between_poses_batch(
+    a: SE2 | SE3 | SE2Batch | SE3Batch, b: SE2 | SE3 | SE2Batch | SE3Batch
+) -> np.ndarray:
+    """Vectorized distance between poses, see distance_between_configurations."""
+    if isinstance(a, (SE2, SE2Batch)):
+        single_type, batch_type = SE2, SE2Batch
+    else:
+        single_type, batch_type = SE3, SE3Batch
+    assert isinstance(a, (single_type, batch_type))
+    assert isinstance(b, (single_type, batch_type))
+    many_to_many = isinstance(a, batch_type) and isinstance(b, batch_type)
+    a = a if isinstance(a, batch_type) else batch_type.from_poses([a])
+    b = b if isinstance(b, batch_type) else batch_type.from_poses([b])
+    if many_to_many:
+        ia, ib = np.divmod(np.arange(len(a) * len(b)), len(b))
+        d = a.inverse()[ia] * b[ib]
+    else:
+        d = a.inverse() * b
+    if batch_type is SE2Batch:
+        log_rotation = d.rotation.angle[:, np.newaxis]
+    else:
+        log_rotation = d.rotation.log()
+    dist = np.linalg.norm(np.hstack((d.translation, log_rotation)), axis=-1)
+    return dist.reshape(len(a), len(b)) if many_to_many else dist
+
+
+def stack_configurations(
+    configurations: list[ArrayLike | SE2 | SE3],
+) -> np.ndarray | SE2Batch | SE3Batch:
+    """Stack a list of configurations into (N, dof) array or SE2Batch/SE3Batch."""
+    if len(configurations) > 0 and isinstance(configurations[0], SE2):
+        return SE2Batch.from_poses(configurations)
+    elif len(configurations) > 0 and isinstance(configurations[0], SE3):
+        return SE3Batch.from_poses(configurations)
+    return np.asarray(configurations)
 
 
 def interpolate(
@@ -44,3 +92,51 @@ def interpolate(
         return a * SE3(translation=log_diff[:3], rotation=SO3.exp(log_diff[3:]))
     else:
         return a + d * (b - a) / distance_between_configurations(a, b)
+
+
+def discretize(
+    a: ArrayLike | SE2 | SE3, b: ArrayLike | SE2 | SE3, step: float
+) -> np.ndarray | SE2Batch | SE3Batch:
+    """Discretize the geodesic between two configurations into equidistant
+    configurations that are at most @param step apart. The configuration a is
+    excluded and b is included. Returns (K, dof) array for joint space configurations
+    or SE2Batch/SE3Batch of K poses for task-space configurations."""
+    assert isinstance(a, type(b))
+    if isinstance(a, SE2):
+        start = SE2Batch.from_poses([a])
+        diff = start.inverse() * b
+        log_diff = np.append(diff.translation[0], diff.rotation.angle[0])
+        s = _discretization_steps(np.linalg.norm(log_diff), step)[:, np.newaxis]
+        return start * SE2Batch(s * log_diff[:2], s[:, 0] * log_diff[2])
+    elif isinstance(a, SE3):
+        start = SE3Batch.from_poses([a])
+        diff = start.inverse() * b
+        log_diff = np.append(diff.translation[0], diff.rotation.log()[0])
+        s = _discretization_steps(np.linalg.norm(log_diff), step)[:, np.newaxis]
+        return start * SE3Batch(s * log_diff[:3], SO3Batch.exp(s * log_diff[3:]))
+    else:
+        a, b = np.asarray(a), np.asarray(b)
+        s = _discretization_steps(np.linalg.norm(b - a), step)[:, np.newaxis]
+        return a + s * (b - a)
+
+
+def _discretization_steps(distance: float, step: float) -> np.ndarray:
+    """Return fractions (0, 1] of the distance that split it into the smallest number
+    of equal segments not longer than step."""
+    k = max(int(np.ceil(distance / step - 1e-9)), 1)
+    return np.arange(1, k + 1) / k
+
+
+def bisection_order(n: int) -> np.ndarray:
+    """Return permutation of range(n) that visits the middle element first and then
+    recursively the middles of the remaining halves (breadth first), i.e. the order
+    in which a path is checked for collision to find collisions early."""
+    order = []
+    intervals = deque([(0, n)])
+    while intervals:
+        lo, hi = intervals.popleft()
+        if lo < hi:
+            mid = (lo + hi) // 2
+            order.append(mid)
+            intervals.extend(((lo, mid), (mid + 1, hi)))
+    return np.asarray(order, dtype=int)
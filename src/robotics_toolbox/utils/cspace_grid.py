@@ -0,0 +1,166 @@
+#!/usr/bin/env python
+#
+# Copyright (c) CTU -- All Rights Reserved
+# Created on: 2026-10-18
+#
+
+"""Module for precomputed configuration space occupancy of planar robots."""
+
+from __future__ import annotations
+import json
+from pathlib import Path
+import numpy as np
+import shapely
+from numpy.typing import ArrayLike
+from scipy.ndimage import binary_dilation
+from shapely.geometry.base import BaseGeometry
+
+from robotics_toolbox.utils.obstacle_world import ObstacleWorld
+
+
+class ConfigurationSpaceGrid:
+    def __init__(
+        self,
+        occupancy: np.ndarray,
+        lower: ArrayLike,
+        resolution: float,
+    ) -> None:
+        """Occupancy grid (nx, ny, n_headings) over (x, y, theta) configurations of
+        a planar robot. Cell [i, j, k] is centered at lower + resolution * [i, j] and
+        covers headings [-pi + k * dtheta, -pi + (k + 1) * dtheta). The occupancy is
+        conservative, i.e. a cell is free only if all configurations inside the cell
+        are collision free. Use from_footprint to compute the grid."""
+        super().__init__()
+        self.occupancy = occupancy
+        self.lower = np.asarray(lower, dtype=float)
+        self.resolution = resolution
+
+    @property
+    def n_headings(self) -> int:
+        """Number of heading bins."""
+        return self.occupancy.shape[2]
+
+    @staticmethod
+    def from_footprint(
+        obstacles: BaseGeometry | None,
+        footprint: ArrayLike,
+        lower: ArrayLike,
+        upper: ArrayLike,
+        resolution: float = 0.02,
+        n_headings: int = 64,
+    ) -> ConfigurationSpaceGrid:
+        """Compute occupancy of the robot with footprint polygon given by vertices
+        (M, 2) in the robot frame. The obstacles are rasterized conservatively and
+        dilated by the footprint swept over each heading bin (Minkowski sum)."""
+        footprint = np.asarray(footprint, dtype=float)
+        lower, upper = np.asarray(lower, dtype=float), np.asarray(upper, dtype=float)
+        shape = np.ceil((upper - lower) / resolution).astype(int) + 1
+        radius = np.max(np.linalg.norm(footprint, axis=-1))
+        h = int(np.ceil(radius / resolution)) + 1
+
+        # obstacles outside of the box up to the robot radius affect the occupancy
+        ix, iy = np.indices(shape + 2 * h)
+        centers = lower + resolution * (np.stack((ix, iy), axis=-1) - h)
+        lo, hi = centers - resolution / 2, centers + resolution / 2
+        cells = shapely.box(lo[..., 0], lo[..., 1], hi[..., 0], hi[..., 1])
+        world = ObstacleWorld(obstacles)
+        obstacle_cells = world.intersects_batch(cells.ravel()).reshape(cells.shape)
+
+        # kernel cells are offsets of the obstacle cells w.r.t. the robot cell
+        kx, ky = np.indices((2 * h + 1, 2 * h + 1))
+        offsets = resolution * (np.stack((kx, ky), axis=-1) - h)
+        lo, hi = offsets - resolution / 2, offsets + resolution / 2
+        kernel_cells = shapely.box(lo[..., 0], lo[..., 1], hi[..., 0], hi[..., 1])
+
+        d_theta = 2 * np.pi / n_headings
+        samples = 8
+        # robot can be anywhere in its cell and the heading anywhere in the bin
+        sweep_error = radius * d_theta / (2 * (samples - 1))
+        cell_radius = resolution * np.sqrt(2) / 2
+
+        occupancy = np.empty((*shape, n_headings), dtype=bool)
+        for k in range(n_headings):
+            angles = -np.pi + d_theta * (k + np.linspace(0, 1, samples))
+            c, s = np.cos(angles), np.sin(angles)
+            rot = np.stack((np.stack((c, -s), -1), np.stack((s, c), -1)), -2)
+            swept = shapely.union_all(
+                shapely.polygons(footprint @ rot.transpose(0, 2, 1))
+            )
+            swept = swept.buffer(sweep_error + cell_radius)
+            kernel = shapely.intersects(kernel_cells, swept)
+            dilated = binary_dilation(obstacle_cells, structure=kernel[::-1, ::-1])
+            occupancy[..., k] = dilated[h:-h, h:-h]
+        return ConfigurationSpaceGrid(occupancy, lower, resolution)
+
+    def indices(
+        self, translations: ArrayLike, angles: ArrayLike
+    ) -> tuple[np.ndarray, ...]:
+        """Return cell indices (i, j, k) of the configurations and a mask of the
+        configurations inside the grid."""
+        t = np.asarray(translations, dtype=float).reshape(-1, 2)
+        ij = np.rint((t - self.lower) / self.resolution).astype(int)
+        valid = np.all((ij >= 0) & (ij < self.occupancy.shape[:2]), axis=-1)
+        ij[~valid] = 0
+        k = np.floor((np.asarray(angles) + np.pi) / (2 * np.pi) * self.n_headings)
+        return ij[:, 0], ij[:, 1], k.astype(int).reshape(-1) % self.n_headings, valid
+
+    def occupied(self, translations: ArrayLike, angles: ArrayLike) -> np.ndarray:
+        """Return occupancy (N,) of configurations given by translations (N, 2) and
+        angles (N,). Configurations outside of the grid are occupied."""
+        i, j, k, valid = self.indices(translations, angles)
+        return ~valid | self.occupancy[i, j, k]
+
+    def save(self, path: Path | str):
+        """Save occupancy into .npy file and metadata into .json file next to it."""
+        path = Path(path).with_suffix(".npy")
+        np.save(path, self.occupancy)
+        metadata = {"lower": self.lower.tolist(), "resolution": self.resolution}
+        path.with_suffix(".json").write_text(json.dumps(metadata))
+
+    @staticmethod
+    def load(path: Path | str, mmap: bool = True) -> ConfigurationSpaceGrid:
+        """Load grid stored by save. The occupancy is memory mapped by default."""
+        path = Path(path).with_suffix(".npy")
+        metadata = json.loads(path.with_suffix(".json").read_text())
+        occupancy = np.load(path, mmap_mode="r" if mmap else None)
+        return ConfigurationSpaceGrid(
+            occupancy, metadata["lower"], metadata["resolution"]
+        )
+
+
+if __name__ == "__main__":
+    import tempfile
+    import time
+    from shapely import MultiPolygon, Point
+    from robotics_toolbox.core import SE2Batch
+    from robotics_toolbox.robots import MobileRobot
+
+    robot = MobileRobot(size=0.05)
+    robot.obstacles = MultiPolygon(
+        [
+            Point(c).buffer(0.05, cap_style=3)
+            for c in np.random.uniform(-1, 1, size=(100, 2))
+        ]
+    )
+
+    start = time.perf_counter()
+    grid = robot.compute_cspace_grid()
+    print(f"Grid {grid.occupancy.shape} computed in {time.perf_counter() - start}s")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        grid.save(Path(tmp).joinpath("cspace"))
+        grid = ConfigurationSpaceGrid.load(Path(tmp).joinpath("cspace"))
+
+        n = 100000
+        poses = SE2Batch(
+            np.random.uniform(-1, 1, size=(n, 2)), np.random.uniform(-np.pi, np.pi, n)
+        )
+        start = time.perf_counter()
+        occupied = grid.occupied(poses.translation, poses.rotation.angle)
+        print(f"Grid queries per second: {n / (time.perf_counter() - start)}")
+        start = time.perf_counter()
+        collision = robot.in_collision_batch(poses)
+        print(f"Exact checks per second: {n / (time.perf_counter() - start)}")
+        print(f"Grid is conservative: {np.all(occupied[collision])}")
+        print(f"Free configurations marked occupied: {np.mean(occupied[~collision])}")
+        del grid
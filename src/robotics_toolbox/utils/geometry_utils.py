@@ -7,7 +7,9 @@
 from __future__ import annotations
 
 import numpy as np
+import shapely
 from numpy.typing import ArrayLike
+from shapely.geometry.base import BaseGeometry
 
 
 def nullspace(A, atol=1e-13, rtol=0.0):
@@ -79,3 +81,62 @@ def circle_line_intersection(
             y = (-d * dx + pm * np.abs(dy) * np.sqrt(discriminant)) / (dr**2)
             sols.append(np.array([x, y]) + c)
         return sols
+
+
+def segments_intersect(
+    a0: ArrayLike, a1: ArrayLike, b0: ArrayLike, b1: ArrayLike
+) -> np.ndarray:
+    """Test if segments (a0, a1) and (b0, b1) intersect, touching and collinear
+    overlapping segments are intersecting. Inputs are 2D points (..., 2) that are
+    broadcasted against each other, returns boolean array of the broadcasted shape."""
+    a0, a1, b0, b1 = (np.asarray(v, dtype=float) for v in (a0, a1, b0, b1))
+
+    def orientation(p, q, r):
+        return np.sign(
+            (q[..., 0] - p[..., 0]) * (r[..., 1] - p[..., 1])
+            - (q[..., 1] - p[..., 1]) * (r[..., 0] - p[..., 0])
+        )
+
+    o1, o2 = orientation(b0, b1, a0), orientation(b0, b1, a1)
+    o3, o4 = orientation(a0, a1, b0), orientation(a0, a1, b1)
+    collinear = (o1 == 0) & (o2 == 0) & (o3 == 0) & (o4 == 0)
+    overlap = np.all(
+        np.maximum(np.minimum(a0, a1), np.minimum(b0, b1))
+        <= np.minimum(np.maximum(a0, a1), np.maximum(b0, b1)),
+        axis=-1,
+    )
+    return np.where(collinear, overlap, (o1 * o2 <= 0) & (o3 * o4 <= 0))
+
+
+def ray_crosses_segment(
+    points: ArrayLike, edges_start: ArrayLike, edges_end: ArrayLike
+) -> np.ndarray:
+    """Test if the ray from points (..., 2) in the +x direction crosses the segments
+    given by start and end points. Inputs are broadcasted against each other."""
+    p = np.asarray(points, dtype=float)
+    e0, e1 = np.asarray(edges_start, dtype=float), np.asarray(edges_end, dtype=float)
+    straddle = (e0[..., 1] > p[..., 1]) != (e1[..., 1] > p[..., 1])
+    dy = np.where(straddle, e1[..., 1] - e0[..., 1], 1.0)
+    x = e0[..., 0] + (p[..., 1] - e0[..., 1]) * (e1[..., 0] - e0[..., 0]) / dy
+    return straddle & (p[..., 0] < x)
+
+
+def polygon_edges(
+    geometry: BaseGeometry | None, return_index: bool = False
+) -> tuple[np.ndarray, ...]:
+    """Return start and end points (E, 2) of all edges of all rings (exterior and
+    interior) of the given (multi)polygon. Empty arrays are returned for None. If
+    @param return_index is true, the index (E,) of the polygon each edge belongs to
+    is returned as the third value."""
+    if geometry is None:
+        empty = np.empty((0, 2)), np.empty((0, 2))
+        return empty + (np.empty(0, dtype=int),) if return_index else empty
+    rings, ring_polygon = shapely.get_rings(
+        shapely.get_parts(geometry), return_index=True
+    )
+    coords, index = shapely.get_coordinates(rings, return_index=True)
+    same_ring = index[:-1] == index[1:]
+    edges = coords[:-1][same_ring], coords[1:][same_ring]
+    if return_index:
+        return edges + (ring_polygon[index[:-1][same_ring]],)
+    return edges
@@ -0,0 +1,72 @@
+#!/usr/bin/env python
+#
+# Copyright (c) CTU -- All Rights Reserved
+# Created on: 2026-10-18
+#
+
+"""Module for representing obstacles prepared for repeated collision queries."""
+
+from __future__ import annotations
+import numpy as np
+import shapely
+from numpy.typing import ArrayLike
+from shapely import STRtree
+from shapely.geometry.base import BaseGeometry
+
+from robotics_toolbox.utils.geometry_utils import polygon_edges
+
+
+class ObstacleWorld:
+    def __init__(self, obstacles: BaseGeometry | None = None) -> None:
+        """Wraps the (multi)polygon of obstacles for fast collision queries. The
+        individual polygons are prepared and indexed by STRtree so that only polygons
+        with overlapping bounding boxes are tested. The world is immutable; create
+        a new one if obstacles change."""
+        super().__init__()
+        self.obstacles = obstacles
+        self.polygons: np.ndarray = (
+            np.empty(0, dtype=object)
+            if obstacles is None
+            else shapely.get_parts(obstacles)
+        )
+        shapely.prepare(self.polygons)
+        self.tree = STRtree(self.polygons)
+        self.edges_start, self.edges_end, self.edges_polygon = polygon_edges(
+            obstacles, return_index=True
+        )
+        self._edges_offset = np.searchsorted(
+            self.edges_polygon, np.arange(len(self.polygons) + 1)
+        )
+
+    def __len__(self) -> int:
+        """Number of polygons in the world."""
+        return len(self.polygons)
+
+    def intersects(self, geometry: BaseGeometry) -> bool:
+        """Return true if the geometry intersects any obstacle."""
+        candidates = self.tree.query(geometry)
+        return bool(np.any(shapely.intersects(self.polygons[candidates], geometry)))
+
+    def intersects_batch(self, geometries: ArrayLike) -> np.ndarray:
+        """Test N geometries for intersection with any obstacle, returns boolean
+        array (N,)."""
+        geometries = np.asarray(geometries, dtype=object)
+        query, candidates = self.tree.query(geometries)
+        hits = shapely.intersects(self.polygons[candidates], geometries[query])
+        out = np.zeros(len(geometries), dtype=bool)
+        out[query[hits]] = True
+        return out
+
+    def candidate_edges(self, bounds: ArrayLike) -> tuple[np.ndarray, np.ndarray]:
+        """Return pairs (query index, edge index) of edges that belong to polygons
+        whose bounding box overlaps the given bounds (N, 4) [minx, miny, maxx, maxy].
+        All edges of a polygon are returned, i.e. the pairs can be used for both
+        intersection and even-odd containment tests. Polygons may overlap, so the
+        crossings are counted per polygon given by self.edges_polygon."""
+        b = np.asarray(bounds, dtype=float).reshape(-1, 4)
+        query, candidates = self.tree.query(shapely.box(*b.T))
+        start = self._edges_offset[candidates]
+        count = self._edges_offset[candidates + 1] - start
+        query = np.repeat(query, count)
+        first = np.repeat(start - np.cumsum(count) + count, count)
+        return query, first + np.arange(len(query))
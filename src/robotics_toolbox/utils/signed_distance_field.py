@@ -0,0 +1,60 @@
+#!/usr/bin/env python
+#
+# Copyright (c) CTU -- All Rights Reserved
+# Created on: 2026-10-18
+#
+
+"""Module for representing signed distance field of planar obstacles."""
+
+from __future__ import annotations
+import numpy as np
+import shapely
+from numpy.typing import ArrayLike
+from shapely import STRtree
+from shapely.geometry.base import BaseGeometry
+
+
+class SignedDistanceField:
+    def __init__(
+        self,
+        obstacles: BaseGeometry | None,
+        lower: ArrayLike,
+        upper: ArrayLike,
+        resolution: float = 0.01,
+    ) -> None:
+        """Rasterize the signed distance to the obstacles on a regular grid covering
+        the box from @param lower to @param upper with the given resolution. Distance
+        is positive outside and negative inside the obstacles, +inf if there are no
+        obstacles. The field is immutable; create a new one if obstacles change."""
+        super().__init__()
+        self.obstacles = obstacles
+        self.lower = np.asarray(lower, dtype=float)
+        self.upper = np.asarray(upper, dtype=float)
+        self.resolution = resolution
+        # value at any point differs from the value of the nearest sample by at most
+        # the distance to that sample as signed distance is 1-Lipschitz
+        self.margin = resolution * np.sqrt(2) / 2
+
+        shape = np.ceil((self.upper - self.lower) / resolution).astype(int) + 1
+        ix, iy = np.indices(shape)
+        points = self.lower + resolution * np.stack((ix, iy), axis=-1).reshape(-1, 2)
+        self.values = np.full(len(points), np.inf)
+        if obstacles is not None and not obstacles.is_empty:
+            polygons = shapely.get_parts(obstacles)
+            tree = STRtree(shapely.boundary(polygons))
+            _, distance = tree.query_nearest(
+                shapely.points(points), return_distance=True, all_matches=False
+            )
+            inside = shapely.contains_xy(obstacles, points[:, 0], points[:, 1])
+            self.values = np.where(inside, -distance, distance)
+        self.values = self.values.reshape(shape)
+
+    def value(self, points: ArrayLike) -> np.ndarray:
+        """Return signed distance (N,) of the grid samples nearest to the points
+        (N, 2). The error is bounded by self.margin; NaN is returned for points
+        outside the grid."""
+        p = np.asarray(points, dtype=float).reshape(-1, 2)
+        index = np.rint((p - self.lower) / self.resolution).astype(int)
+        valid = np.all((index >= 0) & (index < self.values.shape), axis=-1)
+        index[~valid] = 0
+        return np.where(valid, self.values[index[:, 0], index[:, 1]], np.nan)
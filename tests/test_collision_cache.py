@@ -0,0 +1,54 @@
+#!/usr/bin/env python
+#
+# Copyright (c) CTU -- All Rights Reserved
+# Created on: 2026-10-18
+#
+import unittest
+import numpy as np
+
+from robotics_toolbox.core import SE2Batch, SE3Batch, SO3Batch
+from robotics_toolbox.utils import CollisionCache
+
+
+class TestCollisionCache(unittest.TestCase):
+    def test_lru_eviction_and_stats(self):
+        cache = CollisionCache(maxsize=2)
+        a, b, c = (cache.key(np.array([v, 0.0])) for v in (0.1, 0.2, 0.3))
+        self.assertIsNone(cache.get(a))
+        cache.put(a, True)
+        cache.put(b, False)
+        self.assertTrue(cache.get(a))
+        cache.put(c, True)
+        self.assertEqual(len(cache), 2)
+        self.assertIsNone(cache.get(b))
+        self.assertTrue(cache.get(a))
+        self.assertTrue(cache.get(c))
+        self.assertEqual((cache.hits, cache.misses), (3, 2))
+        self.assertAlmostEqual(cache.hit_rate, 0.6)
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+
+    def test_quantization(self):
+        cache = CollisionCache(resolution=1e-3)
+        self.assertEqual(cache.key([0.1, 0.2]), cache.key([0.1001, 0.1999]))
+        self.assertNotEqual(cache.key([0.1, 0.2]), cache.key([0.102, 0.2]))
+
+    def test_batch_keys_match_single_keys(self):
+        np.random.seed(0)
+        cache = CollisionCache()
+        q = np.random.uniform(-1, 1, size=(5, 3))
+        self.assertEqual(cache.keys(q), [cache.key(v) for v in q])
+        self.assertEqual(cache.keys(list(q)), cache.keys(q))
+
+        angles = np.random.uniform(-np.pi, np.pi, 5)
+        t = np.random.uniform(-1, 1, size=(5, 2))
+        poses = SE2Batch(t, angles)
+        self.assertEqual(cache.keys(poses), [cache.key(poses[i]) for i in range(5)])
+
+        v = np.random.uniform(-1, 1, size=(5, 3))
+        poses = SE3Batch(np.random.uniform(-1, 1, size=(5, 3)), SO3Batch.exp(v))
+        self.assertEqual(cache.keys(poses), [cache.key(poses[i]) for i in range(5)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -8,8 +8,29 @@
 import unittest
 import numpy as np
 
-from robotics_toolbox.core import SE2, SO3, SE3
-from robotics_toolbox.utils import interpolate, distance_between_configurations
+from robotics_toolbox.core import SE2, SO3, SE3, SE2Batch, SE3Batch, SO3Batch
+from robotics_toolbox.utils import (
+    interpolate,
+    distance_between_configurations,
+    discretize,
+    stack_configurations,
+    bisection_order,
+)
+
+
+def random_se2() -> SE2:
+    angle = np.random.uniform(low=-np.pi, high=np.pi)
+    c, s = np.cos(angle), np.sin(angle)
+    return SE2.from_arrays_unchecked(
+        np.random.uniform(low=-10, high=10, size=2), np.array([[c, -s], [s, c]])
+    )
+
+
+def random_se3() -> SE3:
+    return SE3.from_arrays_unchecked(
+        np.random.uniform(low=-10, high=10, size=3),
+        SO3Batch.exp(np.random.uniform(low=-1, high=1, size=3)).rot[0],
+    )
 
 
 class TestConfigurationUtils(unittest.TestCase):
@@ -46,6 +67,91 @@ class TestConfigurationUtils(unittest.TestCase):
         c = interpolate(a, b, d)
         self.assertAlmostEqual(distance_between_configurations(a, c), d)
 
+    def test_discretize_array(self):
+        np.random.seed(0)
+        a = np.random.uniform(low=-np.pi, high=np.pi, size=5)
+        b = np.random.uniform(low=-np.pi, high=np.pi, size=5)
+        path = discretize(a, b, 0.31)
+        self.assertEqual(path.shape[1], 5)
+        self.assertTrue(np.allclose(path[-1], b))
+        steps = np.linalg.norm(np.diff(np.vstack((a, path)), axis=0), axis=-1)
+        self.assertTrue(np.all(steps <= 0.31))
+        self.assertTrue(np.allclose(steps, steps[0]))
+        self.assertEqual(len(path), int(np.ceil(np.linalg.norm(b - a) / 0.31)))
+        self.assertEqual(len(discretize(a, a, 0.31)), 1)
+
+    def test_discretize_se2(self):
+        np.random.seed(0)
+        a, b = random_se2(), random_se2()
+        path = discretize(a, b, 0.31)
+        self.assertIsInstance(path, SE2Batch)
+        self.assertTrue(np.allclose(path.homogeneous()[-1], b.homogeneous()))
+        poses = SE2Batch.from_poses([a] + [path[i] for i in range(len(path))])
+        d = poses[:-1].inverse() * poses[1:]
+        steps = np.linalg.norm(
+            np.column_stack((d.translation, d.rotation.angle)), axis=-1
+        )
+        self.assertTrue(np.all(steps <= 0.31 + 1e-9))
+        self.assertTrue(np.allclose(steps, steps[0]))
+
+    def test_discretize_se3(self):
+        np.random.seed(0)
+        a, b = random_se3(), random_se3()
+        path = discretize(a, b, 0.31)
+        self.assertIsInstance(path, SE3Batch)
+        self.assertTrue(np.allclose(path.homogeneous()[-1], b.homogeneous()))
+        poses = SE3Batch.from_poses([a] + [path[i] for i in range(len(path))])
+        d = poses[:-1].inverse() * poses[1:]
+        steps = np.linalg.norm(
+            np.column_stack((d.translation, d.rotation.log())), axis=-1
+        )
+        self.assertTrue(np.all(steps <= 0.31 + 1e-9))
+        self.assertTrue(np.allclose(steps, steps[0]))
+
+    def test_distance_one_to_many_array(self):
+        np.random.seed(0)
+        a = np.random.uniform(low=-np.pi, high=np.pi, size=5)
+        b = np.random.uniform(low=-np.pi, high=np.pi, size=(20, 5))
+        ref = [distance_between_configurations(a, bi) for bi in b]
+        self.assertTrue(np.allclose(distance_between_configurations(a, b), ref))
+        self.assertTrue(np.allclose(distance_between_configurations(b, a), ref))
+        d = distance_between_configurations(b[:3], b)
+        self.assertEqual(d.shape, (3, 20))
+        self.assertTrue(np.allclose(d[1], distance_between_configurations(b[1], b)))
+
+    def test_distance_one_to_many_poses(self):
+        np.random.seed(0)
+        for sample, batch_type in ((random_se2, SE2Batch), (random_se3, SE3Batch)):
+            a = sample()
+            poses = [sample() for _ in range(20)]
+            b = stack_configurations(poses)
+            self.assertIsInstance(b, batch_type)
+            d = distance_between_configurations(a, b)
+            self.assertEqual(d.shape, (20,))
+            for di, pose in zip(d, poses):
+                h = np.linalg.inv(a.homogeneous()) @ pose.homogeneous()
+                if batch_type is SE2Batch:
+                    log_rot = [np.arctan2(h[1, 0], h[0, 0])]
+                    t = h[:2, 2]
+                else:
+                    log_rot = SO3Batch(h[np.newaxis, :3, :3]).log()[0]
+                    t = h[:3, 3]
+                self.assertAlmostEqual(di, np.linalg.norm(np.append(t, log_rot)))
+            self.assertTrue(np.allclose(distance_between_configurations(b, a), d))
+            dd = distance_between_configurations(b[:4], b)
+            self.assertEqual(dd.shape, (4, 20))
+            self.assertTrue(
+                np.allclose(dd[0], distance_between_configurations(b[0], b))
+            )
+            self.assertTrue(np.allclose(np.diagonal(dd), 0))
+
+    def test_bisection_order(self):
+        self.assertEqual(bisection_order(0).tolist(), [])
+        self.assertEqual(bisection_order(1).tolist(), [0])
+        self.assertEqual(bisection_order(7).tolist(), [3, 1, 5, 0, 2, 4, 6])
+        for n in range(1, 50):
+            self.assertEqual(sorted(bisection_order(n)), list(range(n)))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,130 @@
+#!/usr/bin/env python
+#
+# Copyright (c) CTU -- All Rights Reserved
+# Created on: 2026-10-18
+#
+import unittest
+import numpy as np
+import pinocchio as pin
+
+from robotics_toolbox.core import SO2, SO3, SE2, SE3, PoseKey
+
+
+def rot2(angle: float) -> np.ndarray:
+    c, s = np.cos(angle), np.sin(angle)
+    return np.array([[c, -s], [s, c]])
+
+
+def random_se2() -> SE2:
+    rotation = SO2()
+    rotation.rot = rot2(np.random.uniform(-np.pi, np.pi))
+    return SE2(np.random.uniform(-10, 10, size=2), rotation)
+
+
+def random_se3() -> SE3:
+    return SE3(
+        np.random.uniform(-10, 10, size=3),
+        SO3(pin.exp3(np.random.uniform(-np.pi, np.pi, size=3))),
+    )
+
+
+class TestCoreFastPaths(unittest.TestCase):
+    def test_so2_act_block(self):
+        np.random.seed(0)
+        r = SO2()
+        r.rot = rot2(np.random.uniform(-np.pi, np.pi))
+        v = np.random.uniform(-1, 1, size=(100, 2))
+        ref = np.array([r.act(vi) for vi in v])
+        self.assertTrue(np.allclose(r.act(v), ref))
+        out = np.empty_like(v)
+        res = r.act(v, out=out)
+        self.assertIs(res, out)
+        self.assertTrue(np.allclose(out, ref))
+
+    def test_so3_act_block(self):
+        np.random.seed(0)
+        r = SO3(pin.exp3(np.random.uniform(-1, 1, size=3)))
+        v = np.random.uniform(-1, 1, size=(100, 3))
+        ref = np.array([r.rot @ vi for vi in v])
+        self.assertTrue(np.allclose(r.act(v), ref))
+        out = np.empty_like(v)
+        r.act(v, out=out)
+        self.assertTrue(np.allclose(out, ref))
+        self.assertTrue(np.allclose(r.act(v[0]), ref[0]))
+
+    def test_compose_into(self):
+        np.random.seed(0)
+        for sample in (random_se2, random_se3):
+            for _ in range(10):
+                a, b, c = sample(), sample(), sample()
+                ref = a.homogeneous() @ b.homogeneous()
+                translation, rotation = c.translation, c.rotation.rot
+                self.assertIs(a.compose_into(b, c), c)
+                self.assertTrue(np.allclose(c.homogeneous(), ref))
+                self.assertIs(c.translation, translation)
+                self.assertIs(c.rotation.rot, rotation)
+
+                ref_ab = a.homogeneous() @ b.homogeneous()
+                a.compose_into(b, b)
+                self.assertTrue(np.allclose(b.homogeneous(), ref_ab))
+                ref_aa = a.homogeneous() @ a.homogeneous()
+                a.compose_into(a, a)
+                self.assertTrue(np.allclose(a.homogeneous(), ref_aa))
+
+    def test_inverse_into(self):
+        np.random.seed(0)
+        for sample in (random_se2, random_se3):
+            for _ in range(10):
+                a, b = sample(), sample()
+                ref = np.linalg.inv(a.homogeneous())
+                self.assertIs(a.inverse_into(b), b)
+                self.assertTrue(np.allclose(b.homogeneous(), ref))
+                a.inverse_into(a)
+                self.assertTrue(np.allclose(a.homogeneous(), ref))
+
+    def test_rotation_compose_into(self):
+        np.random.seed(0)
+        a, b = SO3(pin.exp3(np.ones(3))), SO3(pin.exp3(-np.arange(3.0)))
+        ref = a.rot @ b.rot
+        a.compose_into(b, a)
+        self.assertTrue(np.allclose(a.rot, ref))
+        a.inverse_into(a)
+        self.assertTrue(np.allclose(a.rot, ref.T))
+
+    def test_unchecked_constructors(self):
+        np.random.seed(0)
+        translation = np.random.uniform(-1, 1, size=2)
+        rot = rot2(0.3)
+        t = SE2.from_arrays_unchecked(translation, rot)
+        self.assertIsInstance(t, SE2)
+        self.assertIsInstance(t.rotation, SO2)
+        self.assertIs(t.translation, translation)
+        self.assertIs(t.rotation.rot, rot)
+
+        translation = np.random.uniform(-1, 1, size=3)
+        rot = pin.exp3(np.random.uniform(-1, 1, size=3))
+        t = SE3.from_arrays_unchecked(translation, rot)
+        self.assertIsInstance(t.rotation, SO3)
+        self.assertTrue(np.allclose(t.homogeneous()[:3, :3], rot))
+        self.assertTrue(np.allclose(t.homogeneous()[:3, 3], translation))
+
+    def test_pose_key(self):
+        np.random.seed(0)
+        for sample in (random_se2, random_se3):
+            a, b, c = sample(), sample(), sample()
+            a.compose_into(c, b)
+            c.inverse_into(c)
+            b.compose_into(c, b)
+            # b is equal to a up to numerical errors, but a different object
+            self.assertEqual(a, b)
+            self.assertEqual(a.key(1e-6), b.key(1e-6))
+            self.assertNotEqual(a.key(1e-6), sample().key(1e-6))
+            cache = {PoseKey(a): "cached"}
+            self.assertEqual(cache.get(PoseKey(b)), "cached")
+            self.assertIsNone(cache.get(PoseKey(sample())))
+            self.assertIn(PoseKey(b, 1e-3), {PoseKey(a, 1e-3)})
+            self.assertNotEqual(PoseKey(a.rotation), PoseKey(a))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,81 @@
+#!/usr/bin/env python
+#
+# Copyright (c) CTU -- All Rights Reserved
+# Created on: 2026-10-18
+#
+import tempfile
+import unittest
+from pathlib import Path
+import numpy as np
+import shapely
+from shapely import MultiPolygon, Point
+
+from robotics_toolbox.core import SE2Batch
+from robotics_toolbox.robots import MobileRobot
+from robotics_toolbox.utils import ConfigurationSpaceGrid, ObstacleWorld
+
+
+def random_obstacles(n: int) -> MultiPolygon:
+    centers = np.random.uniform(-1, 1, size=(n, 2))
+    return MultiPolygon([Point(c).buffer(0.05, cap_style=3) for c in centers])
+
+
+class TestConfigurationSpaceGrid(unittest.TestCase):
+    def test_conservative_asymmetric_footprint(self):
+        np.random.seed(0)
+        obstacles = random_obstacles(20)
+        footprint = np.array([[0.15, 0.0], [-0.05, 0.05], [-0.05, -0.05]])
+        grid = ConfigurationSpaceGrid.from_footprint(
+            obstacles, footprint, [-1, -1], [1, 1], resolution=0.02, n_headings=16
+        )
+        self.assertEqual(grid.occupancy.shape, (101, 101, 16))
+        poses = SE2Batch(
+            np.random.uniform(-1.2, 1.2, size=(5000, 2)),
+            np.random.uniform(-np.pi, np.pi, 5000),
+        )
+        vertices = footprint @ poses.rotation.rot.transpose(0, 2, 1)
+        polygons = shapely.polygons(vertices + poses.translation[:, np.newaxis])
+        collision = ObstacleWorld(obstacles).intersects_batch(polygons)
+        occupied = grid.occupied(poses.translation, poses.rotation.angle)
+        self.assertTrue(np.all(occupied[collision]))
+        self.assertGreater(np.mean(~occupied), 0.3)
+
+    def test_save_load(self):
+        np.random.seed(1)
+        robot = MobileRobot(size=0.05)
+        robot.obstacles = random_obstacles(10)
+        grid = robot.compute_cspace_grid(resolution=0.05, n_headings=8)
+        with tempfile.TemporaryDirectory() as tmp:
+            grid.save(Path(tmp).joinpath("grid"))
+            loaded = ConfigurationSpaceGrid.load(Path(tmp).joinpath("grid.npy"))
+            self.assertIsInstance(loaded.occupancy, np.memmap)
+            self.assertTrue(np.array_equal(loaded.occupancy, grid.occupancy))
+            self.assertTrue(np.array_equal(loaded.lower, grid.lower))
+            self.assertEqual(loaded.resolution, grid.resolution)
+            self.assertEqual(loaded.n_headings, 8)
+            del loaded
+
+    def test_cspace_backend(self):
+        np.random.seed(2)
+        robot = MobileRobot(size=0.05)
+        robot.obstacles = random_obstacles(30)
+        poses = SE2Batch(
+            np.random.uniform(-1, 1, size=(1000, 2)),
+            np.random.uniform(-np.pi, np.pi, 1000),
+        )
+        expected = robot.in_collision_batch(poses)
+        single_poses = [poses[i] for i in range(100)]
+        expected_single = [
+            robot.set_configuration(p).in_collision() for p in single_poses
+        ]
+        robot.collision_backend = "cspace"
+        with self.assertRaises(AssertionError):
+            robot.in_collision_batch(poses)
+        robot.compute_cspace_grid(resolution=0.02, n_headings=32)
+        self.assertTrue(np.array_equal(robot.in_collision_batch(poses), expected))
+        for pose, e in zip(single_poses, expected_single):
+            self.assertEqual(robot.set_configuration(pose).in_collision(), e)
+
+
+if __name__ == "__main__":
+    unittest.main()
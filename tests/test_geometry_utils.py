@@ -6,7 +6,15 @@
 #
 import unittest
 import numpy as np
-from robotics_toolbox.utils import circle_circle_intersection, circle_line_intersection
+from shapely import LineString, MultiPolygon, Point, Polygon
+
+from robotics_toolbox.utils import (
+    circle_circle_intersection,
+    circle_line_intersection,
+    segments_intersect,
+    ray_crosses_segment,
+    polygon_edges,
+)
 
 
 class TestGeometryUtils(unittest.TestCase):
@@ -58,6 +66,46 @@ class TestGeometryUtils(unittest.TestCase):
         self.assertAlmostEqual(bx, 0.0)
         self.assertAlmostEqual(by, 2.0)
 
+    def test_segments_intersect(self):
+        self.assertTrue(segments_intersect([0, 0], [1, 1], [0, 1], [1, 0]))
+        self.assertFalse(segments_intersect([0, 0], [1, 0], [0, 1], [1, 1]))
+        self.assertTrue(segments_intersect([0, 0], [1, 0], [1, 0], [2, 1]))  # touch
+        self.assertTrue(segments_intersect([0, 0], [2, 0], [1, 0], [3, 0]))  # overlap
+        self.assertFalse(segments_intersect([0, 0], [1, 0], [2, 0], [3, 0]))
+        self.assertFalse(segments_intersect([0, 0], [1, 0], [2, -1], [2, 1]))
+
+    def test_segments_intersect_shapely(self):
+        np.random.seed(0)
+        # integer coordinates produce many touching and collinear cases
+        a0, a1, b0, b1 = np.random.randint(0, 4, size=(4, 2000, 2)).astype(float)
+        # zero-length segments are not valid shapely geometries
+        valid = np.any(a0 != a1, axis=-1) & np.any(b0 != b1, axis=-1)
+        a0, a1, b0, b1 = a0[valid], a1[valid], b0[valid], b1[valid]
+        expected = [
+            LineString([p, q]).intersects(LineString([r, s]))
+            for p, q, r, s in zip(a0, a1, b0, b1)
+        ]
+        self.assertTrue(np.array_equal(segments_intersect(a0, a1, b0, b1), expected))
+
+    def test_polygon_edges(self):
+        outer = Point(0, 0).buffer(2.0, cap_style=3)
+        polygons = MultiPolygon(
+            [
+                outer.difference(Point(0, 0).buffer(1.0, cap_style=3)),
+                Polygon([(3, 3), (5, 3), (4, 5)]),
+            ]
+        )
+        e0, e1, polygon = polygon_edges(polygons, return_index=True)
+        self.assertEqual(len(e0), 4 + 4 + 3)
+        self.assertTrue(np.array_equal(polygon, [0] * 8 + [1] * 3))
+        np.random.seed(1)
+        points = np.random.uniform(-3, 6, size=(1000, 2))
+        expected = [polygons.contains(Point(p)) for p in points]
+        crossings = ray_crosses_segment(points[:, np.newaxis], e0, e1)
+        inside = np.count_nonzero(crossings, axis=-1) % 2 == 1
+        self.assertTrue(np.array_equal(inside, expected))
+        self.assertEqual(len(polygon_edges(None)[0]), 0)
+
 
 if __name__ == "__main__":
     unittest.main()
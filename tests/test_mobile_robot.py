@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+#
+# Copyright (c) CTU -- All Rights Reserved
+# Created on: 2026-10-18
+#
+import unittest
+import numpy as np
+from shapely import MultiPolygon, Point, affinity
+
+from robotics_toolbox.core import SE2Batch
+from robotics_toolbox.robots import MobileRobot
+
+
+def reference_in_collision(robot: MobileRobot, translation, angle) -> bool:
+    geometry = Point(translation).buffer(robot.size, cap_style=3)
+    geometry = affinity.rotate(geometry, np.rad2deg(angle), "center")
+    return geometry.intersects(robot.obstacles)
+
+
+class TestMobileRobot(unittest.TestCase):
+    def setUp(self) -> None:
+        np.random.seed(0)
+        self.robot = MobileRobot(size=0.1)
+        centers = np.random.uniform(-1, 1, size=(30, 2))
+        self.robot.obstacles = MultiPolygon(
+            [Point(c).buffer(0.05, cap_style=3) for c in centers]
+        )
+        angles = np.random.uniform(-np.pi, np.pi, 500)
+        self.poses = SE2Batch(np.random.uniform(-1, 1, size=(500, 2)), angles)
+        self.expected = [
+            reference_in_collision(self.robot, t, a)
+            for t, a in zip(self.poses.translation, angles)
+        ]
+
+    def test_footprint(self):
+        pose = self.poses[0]
+        expected = affinity.rotate(
+            Point(pose.translation).buffer(0.1, cap_style=3),
+            np.rad2deg(pose.rotation.angle),
+            "center",
+        )
+        footprint = self.robot.footprint(pose)
+        self.assertAlmostEqual(footprint.symmetric_difference(expected).area, 0.0)
+        self.robot.size = 0.2
+        self.assertAlmostEqual(self.robot.footprint(pose).area, 0.16)
+
+    def single_pose_expected(self, n: int) -> list[bool]:
+        """Single poses are rotated by SO2.angle that is implemented in HW01."""
+        poses = [self.poses[i] for i in range(n)]
+        return [
+            reference_in_collision(self.robot, p.translation, p.rotation.angle)
+            for p in poses
+        ]
+
+    def test_in_collision(self):
+        self.assertTrue(any(self.expected) and not all(self.expected))
+        for pose, e in zip(self.poses[:100], self.single_pose_expected(100)):
+            self.assertEqual(self.robot.set_configuration(pose).in_collision(), e)
+
+    def test_in_collision_batch(self):
+        self.assertTrue(
+            np.array_equal(self.robot.in_collision_batch(self.poses), self.expected)
+        )
+        poses = [self.poses[i] for i in range(10)]
+        self.assertTrue(
+            np.array_equal(self.robot.in_collision_batch(poses), self.expected[:10])
+        )
+        self.assertEqual(self.robot.in_collision_batch([]).shape, (0,))
+
+    def test_sdf_backend(self):
+        self.robot.collision_backend = "sdf"
+        self.robot.sdf_resolution = 0.02
+        self.assertTrue(
+            np.array_equal(self.robot.in_collision_batch(self.poses), self.expected)
+        )
+        for pose, e in zip(self.poses[:100], self.single_pose_expected(100)):
+            self.assertEqual(self.robot.set_configuration(pose).in_collision(), e)
+        sdf = self.robot.signed_distance_field()
+        self.assertIs(self.robot.signed_distance_field(), sdf)
+        self.robot.sdf_resolution = 0.05
+        self.assertIsNot(self.robot.signed_distance_field(), sdf)
+        # poses outside of the field are checked exactly
+        poses = SE2Batch(self.poses.translation * 3, self.poses.rotation)
+        expected = [
+            reference_in_collision(self.robot, t, a)
+            for t, a in zip(poses.translation, poses.rotation.angle)
+        ]
+        self.assertTrue(np.array_equal(self.robot.in_collision_batch(poses), expected))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+#
+# Copyright (c) CTU -- All Rights Reserved
+# Created on: 2026-10-18
+#
+import unittest
+import numpy as np
+import shapely
+from shapely import MultiPolygon, Point, box
+
+from robotics_toolbox.robots import PlanarManipulator
+from robotics_toolbox.utils import ObstacleWorld, polygon_edges
+
+
+def random_obstacles(n: int) -> MultiPolygon:
+    centers = np.random.uniform(-10, 10, size=(n, 2))
+    return MultiPolygon(
+        [Point(c).buffer(r) for c, r in zip(centers, np.random.uniform(0.1, 0.5, n))]
+    )
+
+
+class TestObstacleWorld(unittest.TestCase):
+    def test_intersects(self):
+        np.random.seed(0)
+        obstacles = random_obstacles(200)
+        world = ObstacleWorld(obstacles)
+        self.assertEqual(len(world), 200)
+        lower = np.random.uniform(-10, 10, size=(500, 2))
+        boxes = box(*lower.T, *(lower + 0.3).T)
+        expected = shapely.intersects(boxes, obstacles)
+        self.assertTrue(np.array_equal(world.intersects_batch(boxes), expected))
+        for b, e in zip(boxes[:100], expected):
+            self.assertEqual(world.intersects(b), e)
+        self.assertTrue(expected.any() and not expected.all())
+
+    def test_empty(self):
+        world = ObstacleWorld(None)
+        self.assertEqual(len(world), 0)
+        self.assertFalse(world.intersects(box(0, 0, 1, 1)))
+        self.assertEqual(world.intersects_batch([box(0, 0, 1, 1)]).tolist(), [False])
+        k, e = world.candidate_edges([[0, 0, 1, 1]])
+        self.assertEqual(len(k), 0)
+        self.assertEqual(len(e), 0)
+
+    def test_candidate_edges(self):
+        np.random.seed(1)
+        obstacles = random_obstacles(50)
+        world = ObstacleWorld(obstacles)
+        e0, e1, polygon = polygon_edges(obstacles, return_index=True)
+        self.assertTrue(np.array_equal(world.edges_start, e0))
+        self.assertTrue(np.array_equal(world.edges_end, e1))
+        self.assertTrue(np.array_equal(world.edges_polygon, polygon))
+        lower = np.random.uniform(-10, 10, size=(20, 2))
+        bounds = np.hstack((lower, lower + 2.0))
+        k, e = world.candidate_edges(bounds)
+        for i, b in enumerate(bounds):
+            overlapping = world.tree.query(box(*b))
+            expected = np.flatnonzero(np.isin(polygon, overlapping))
+            self.assertTrue(np.array_equal(np.sort(e[k == i]), expected))
+
+    def test_robot_world_invalidation(self):
+        robot = PlanarManipulator()
+        world = robot.obstacle_world()
+        self.assertEqual(len(world), 0)
+        self.assertIs(robot.obstacle_world(), world)
+        robot.obstacles = random_obstacles(3)
+        world = robot.obstacle_world()
+        self.assertEqual(len(world), 3)
+        self.assertIs(robot.obstacle_world(), world)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,218 @@
+#!/usr/bin/env python
+#
+# Copyright (c) CTU -- All Rights Reserved
+# Created on: 2026-10-18
+#
+import unittest
+import numpy as np
+
+from shapely import LineString, MultiLineString, MultiPolygon, Point
+
+from robotics_toolbox.core import SE2
+from robotics_toolbox.robots import PlanarManipulator
+
+
+def homogeneous(angle: float, x: float = 0.0) -> np.ndarray:
+    c, s = np.cos(angle), np.sin(angle)
+    return np.array([[c, -s, c * x], [s, c, s * x], [0, 0, 1.0]])
+
+
+def reference_fk(robot: PlanarManipulator, q: np.ndarray) -> list[np.ndarray]:
+    """FK of all link frames computed by the chain of homogeneous matrices."""
+    rot = robot.base_pose.rotation.rot
+    t = homogeneous(np.arctan2(rot[1, 0], rot[0, 0]))
+    t[:2, 2] = robot.base_pose.translation
+    frames = [t]
+    for qi, li, s in zip(q, robot.link_parameters, robot.structure):
+        t = t @ (homogeneous(qi, li) if s == "R" else homogeneous(li, qi))
+        frames.append(t)
+    return frames
+
+
+def reference_in_collision(robot: PlanarManipulator, q: np.ndarray) -> bool:
+    """Collision checking by shapely geometries computed from the reference FK."""
+    frames = reference_fk(robot, q)
+    points = [t[:2, 2] for t in frames]
+    g, length = robot.gripper_opening / 2.0, robot.gripper_length
+    a, b, c, d = [
+        frames[-1] @ [x, y, 1.0]
+        for x, y in [(0, -g), (0, g), (length, -g), (length, g)]
+    ]
+    gripper_lines = (a[:2], b[:2]), (a[:2], c[:2]), (b[:2], d[:2])
+    links = [LineString([a, b]) for a, b in zip(points[:-2], points[1:-1])]
+    links += [MultiLineString((*gripper_lines, (points[-2], points[-1])))]
+    for i in range(len(links)):
+        for j in range(i + 2, len(links)):
+            if links[i].intersects(links[j]):
+                return True
+    return MultiLineString((*gripper_lines, *zip(points[:-1], points[1:]))).intersects(
+        robot.obstacles
+    )
+
+
+class TestPlanarManipulatorBatch(unittest.TestCase):
+    def test_fk_batch(self):
+        np.random.seed(0)
+        for structure in ["RRR", "PRR", "RPRP", "PPP"]:
+            robot = PlanarManipulator(
+                link_parameters=np.random.uniform(0.2, 1.0, size=len(structure)),
+                structure=structure,
+                base_pose=SE2([0.3, -0.2], 0.7),
+            )
+            q = np.random.uniform(-np.pi, np.pi, size=(20, len(structure)))
+            origins, angles = robot.fk_batch(q)
+            self.assertEqual(origins.shape, (20, len(structure) + 1, 2))
+            self.assertEqual(angles.shape, (20, len(structure) + 1))
+            for qi, oi, ai in zip(q, origins, angles):
+                for t, o, a in zip(reference_fk(robot, qi), oi, ai):
+                    self.assertTrue(np.allclose(t[:2, 2], o))
+                    self.assertTrue(np.allclose(t[:2, :2], homogeneous(a)[:2, :2]))
+
+    def test_fk_batch_empty(self):
+        origins, angles = PlanarManipulator().fk_batch(np.zeros((0, 3)))
+        self.assertEqual(origins.shape, (0, 4, 2))
+        self.assertEqual(angles.shape, (0, 4))
+
+    def test_link_frames_incremental(self):
+        np.random.seed(0)
+        robot = PlanarManipulator(
+            link_parameters=[0.5, 0.3, 0.4, 0.2], structure="RPRR"
+        )
+        for _ in range(50):
+            k = np.random.randint(robot.dof)
+            if np.random.rand() < 0.5:
+                robot.q[k:] = np.random.uniform(-np.pi, np.pi, size=robot.dof - k)
+            else:
+                robot.set_configuration(np.random.uniform(-1, 1, size=robot.dof))
+            origins, angles = robot.fk_batch(robot.q[np.newaxis])
+            o, a = robot._link_frames()
+            self.assertTrue(np.allclose(o, origins[0]))
+            self.assertTrue(np.allclose(a, angles[0]))
+
+    def test_link_frames_invalidation(self):
+        robot = PlanarManipulator()
+        o0 = robot._link_frames()[0].copy()
+        robot.base_pose.translation[0] += 1.0
+        self.assertTrue(np.allclose(robot._link_frames()[0], o0 + [1.0, 0.0]))
+        robot.link_parameters = np.array([1.0, 1.0, 1.0])
+        o, _ = robot._link_frames()
+        self.assertTrue(np.allclose(o, robot.fk_batch(robot.q[np.newaxis])[0][0]))
+        robot.structure = "PRR"
+        o, _ = robot._link_frames()
+        self.assertTrue(np.allclose(o, robot.fk_batch(robot.q[np.newaxis])[0][0]))
+
+    def test_in_collision(self):
+        np.random.seed(0)
+        for structure in ["RRR", "RRRRRR", "PRR", "R"]:
+            robot = PlanarManipulator(
+                link_parameters=np.random.uniform(0.2, 1.0, size=len(structure)),
+                structure=structure,
+            )
+            q = np.random.uniform(-np.pi, np.pi, size=(300, len(structure)))
+            expected = [reference_in_collision(robot, qi) for qi in q]
+            self.assertTrue(np.array_equal(robot.in_collision_batch(q), expected))
+            for qi, e in zip(q[:50], expected):
+                self.assertEqual(robot.set_configuration(qi).in_collision(), e)
+
+            robot.obstacles = MultiPolygon(
+                [
+                    Point(0.8, 0.5).buffer(0.3, cap_style=3),
+                    Point(-1.0, -0.5).buffer(0.4),
+                    Point(0, 0).buffer(10.0).difference(Point(0, 0).buffer(5.0)),
+                ]
+            )
+            expected = [reference_in_collision(robot, qi) for qi in q]
+            self.assertTrue(np.array_equal(robot.in_collision_batch(q), expected))
+            self.assertTrue(any(expected))
+            for qi, e in zip(q[:50], expected):
+                self.assertEqual(robot.set_configuration(qi).in_collision(), e)
+
+    def test_in_collision_overlapping_obstacles(self):
+        """Robot inside two overlapping obstacles is in collision."""
+        np.random.seed(0)
+        robot = PlanarManipulator()
+        robot.obstacles = MultiPolygon(
+            [
+                Point(0, 0).buffer(3.0, cap_style=3),
+                Point(0.5, 0.2).buffer(3.0, cap_style=3),
+            ]
+        )
+        self.assertTrue(reference_in_collision(robot, robot.q))
+        self.assertTrue(robot.in_collision())
+        q = np.random.uniform(-np.pi, np.pi, size=(100, robot.dof))
+        expected = [reference_in_collision(robot, qi) for qi in q]
+        self.assertTrue(np.array_equal(robot.in_collision_batch(q), expected))
+
+    def test_gripper_lines(self):
+        robot = PlanarManipulator()
+        origins, angles = robot.fk_batch(robot.q[np.newaxis])
+        c, s = np.cos(angles[0, -1]), np.sin(angles[0, -1])
+        flange = SE2.from_arrays_unchecked(origins[0, -1], np.array([[c, -s], [s, c]]))
+        starts, ends = robot._collision_segments(origins, angles)
+        lines = robot._gripper_lines(flange)
+        self.assertTrue(np.allclose([line[0] for line in lines], starts[0, -3:]))
+        self.assertTrue(np.allclose([line[1] for line in lines], ends[0, -3:]))
+
+    def test_in_collision_batch_empty(self):
+        self.assertEqual(
+            PlanarManipulator().in_collision_batch(np.zeros((0, 3))).shape, (0,)
+        )
+
+    def test_ik_numerical_batch(self):
+        np.random.seed(0)
+        for structure in ["RRR", "PRR", "RRRRR", "RPRPR"]:
+            robot = PlanarManipulator(
+                link_parameters=np.random.uniform(0.2, 0.5, size=len(structure)),
+                structure=structure,
+            )
+            q_desired = robot.sample_configuration()
+            t = reference_fk(robot, q_desired)[-1]
+            desired = SE2.from_arrays_unchecked(t[:2, 2], t[:2, :2])
+            q = robot.q.copy()
+            solutions = robot.ik_numerical_batch(desired, n_seeds=16)
+            self.assertTrue(np.array_equal(robot.q, q))
+            self.assertGreater(len(solutions), 0)
+            revolute = np.asarray([s == "R" for s in structure])
+            distances = []
+            for solution in solutions:
+                t_solution = reference_fk(robot, solution)[-1]
+                self.assertTrue(np.allclose(t_solution, t, atol=1e-3))
+                self.assertTrue(np.all(np.abs(solution[revolute]) <= np.pi))
+                diff = solution - q
+                diff[revolute] = (diff[revolute] + np.pi) % (2 * np.pi) - np.pi
+                distances.append(np.linalg.norm(diff))
+            self.assertTrue(np.all(np.diff(distances) >= 0))
+            self.assertEqual(
+                len(np.unique(np.round(solutions, 2), axis=0)), len(solutions)
+            )
+
+            robot.q = solutions[-1].copy()
+            self.assertTrue(
+                np.allclose(robot.ik_numerical_batch(desired)[0], robot.q, atol=1e-3)
+            )
+
+    def test_ik_numerical_batch_iterations(self):
+        """Error is evaluated after the last step, i.e. a single step can converge."""
+        np.random.seed(0)
+        robot = PlanarManipulator(link_parameters=[0, np.pi / 2], structure="PP")
+        desired = SE2.from_arrays_unchecked(
+            np.array([0.7, 0.2]), homogeneous(np.pi / 2)[:2, :2]
+        )
+        self.assertEqual(len(robot.ik_numerical_batch(desired, max_iterations=0)), 0)
+        solutions = robot.ik_numerical_batch(desired, max_iterations=1, n_seeds=4)
+        self.assertEqual(len(solutions), 1)
+        self.assertTrue(np.allclose(solutions[0], [0.7, 0.2], atol=1e-3))
+
+        robot = PlanarManipulator(link_parameters=[0.5, 0.4, 0.3], structure="RRR")
+        q_desired = robot.sample_configuration()
+        t = reference_fk(robot, q_desired)[-1]
+        desired = SE2.from_arrays_unchecked(t[:2, 2], t[:2, :2])
+        robot.q = q_desired + 0.05
+        for max_iterations in (2, 3):
+            solutions = robot.ik_numerical_batch(desired, max_iterations=max_iterations)
+            self.assertGreater(len(solutions), 0)
+            self.assertTrue(np.allclose(solutions[0], q_desired, atol=1e-3))
+
+
+if __name__ == "__main__":
+    unittest.main()
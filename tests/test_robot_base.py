@@ -0,0 +1,171 @@
+#!/usr/bin/env python
+#
+# Copyright (c) CTU -- All Rights Reserved
+# Created on: 2026-10-18
+#
+import unittest
+import numpy as np
+
+from shapely import MultiPolygon, Point
+
+from robotics_toolbox.core import SE2Batch, SE3Batch
+from robotics_toolbox.robots import PlanarManipulator, MobileRobot, Drone
+from robotics_toolbox.robots.robot_base import RobotBase
+
+
+class PointRobot(RobotBase):
+    """Point in 1D that collides with the interval [lower, upper]."""
+
+    def __init__(self, lower: float, upper: float) -> None:
+        super().__init__()
+        self.lower, self.upper = lower, upper
+        self.q = np.zeros(1)
+        self.checked = []
+
+    def sample_configuration(self) -> np.ndarray:
+        return np.random.uniform(-1, 1, size=1)
+
+    def set_configuration(self, configuration: np.ndarray):
+        self.q = configuration
+        return self
+
+    def configuration(self) -> np.ndarray:
+        return self.q
+
+    def in_collision(self) -> bool:
+        self.checked.append(self.q[0])
+        return self.lower <= self.q[0] <= self.upper
+
+
+class BatchPointRobot(PointRobot):
+    """Point robot with non-vectorized in_collision_batch that counts its calls."""
+
+    def __init__(self, lower: float, upper: float) -> None:
+        super().__init__(lower, upper)
+        self.batch_calls = 0
+
+    def in_collision_batch(self, configurations) -> np.ndarray:
+        self.batch_calls += 1
+        return super().in_collision_batch(configurations)
+
+
+class TestRobotBase(unittest.TestCase):
+    def test_path_in_collision_early_exit(self):
+        robot = PointRobot(0.45, 0.55)
+        path = list(np.linspace(0, 1, 101)[1:, np.newaxis])
+        self.assertTrue(robot.path_in_collision(path))
+        self.assertEqual(len(robot.checked), 1)
+
+        robot = PointRobot(0.9, 0.95)
+        self.assertTrue(robot.path_in_collision(np.linspace(0, 1, 101)[1:, None]))
+        self.assertLess(len(robot.checked), 100)
+
+        robot = PointRobot(2.0, 3.0)
+        self.assertFalse(robot.path_in_collision(path))
+        self.assertEqual(sorted(robot.checked), [q[0] for q in path])
+        self.assertFalse(robot.path_in_collision([]))
+
+    def test_path_in_collision_not_vectorized(self):
+        robot = BatchPointRobot(0.45, 0.55)
+        path = np.linspace(0, 1, 101)[1:, np.newaxis]
+        self.assertTrue(robot.path_in_collision(path))
+        self.assertTrue(robot.segment_in_collision([0.0], [1.0], 0.01))
+        self.assertEqual(len(robot.checked), 2)
+        self.assertEqual(robot.batch_calls, 0)
+
+    def test_segment_in_collision(self):
+        robot = PointRobot(0.505, 0.535)
+        self.assertFalse(robot.segment_in_collision([0.0], [1.0], 0.05))
+        self.assertTrue(robot.segment_in_collision([0.0], [1.0], 0.01))
+        robot.checked.clear()
+        self.assertFalse(robot.segment_in_collision([0.0], [0.4], 0.01))
+        self.assertEqual(len(robot.checked), 40)
+        self.assertNotIn(0.0, robot.checked)
+
+    def test_segment_in_collision_batch(self):
+        robot = PlanarManipulator(link_parameters=[0.5, 0.5, 0.5])
+        q_a, q_b = np.zeros(3), np.array([0.0, 3.0, 3.0])
+        configurations = np.linspace(q_a, q_b, 101)[1:]
+        expected = any(
+            robot.set_configuration(q).in_collision() for q in configurations
+        )
+        self.assertTrue(expected)
+        self.assertEqual(robot.segment_in_collision(q_a, q_b, 0.03), expected)
+        self.assertEqual(robot.path_in_collision(list(configurations)), expected)
+        self.assertFalse(robot.segment_in_collision(q_a, -q_b / 3, 0.03))
+
+    def test_default_batch_api(self):
+        np.random.seed(0)
+        robot = PointRobot(-0.5, 0.0)
+        q = robot.sample_configurations(100)
+        self.assertEqual(q.shape, (100, 1))
+        self.assertTrue(np.all(np.abs(q) <= 1))
+        robot.set_configuration(np.array([0.7]))
+        collision = robot.in_collision_batch(q)
+        self.assertTrue(np.array_equal(collision, (q[:, 0] >= -0.5) & (q[:, 0] <= 0)))
+        self.assertEqual(robot.configuration()[0], 0.7)
+        self.assertEqual(robot.in_collision_batch([]).shape, (0,))
+
+    def test_vectorized_batch_api(self):
+        np.random.seed(0)
+        planar = PlanarManipulator()
+        planar.obstacles = MultiPolygon([Point(0.5, 0.5).buffer(0.3)])
+        mobile = MobileRobot(size=0.1)
+        mobile.obstacles = MultiPolygon([Point(0.5, 0.5).buffer(0.3)])
+        for robot, batch_type in [
+            (planar, np.ndarray),
+            (mobile, SE2Batch),
+            (Drone(), SE3Batch),
+        ]:
+            q = robot.sample_configurations(50)
+            self.assertIsInstance(q, batch_type)
+            self.assertEqual(len(q), 50)
+            expected = RobotBase.in_collision_batch(robot, q)
+            self.assertTrue(np.array_equal(robot.in_collision_batch(q), expected))
+        self.assertTrue(np.all(planar.sample_configurations(10) <= planar.q_max))
+
+    def test_collision_cache(self):
+        robot = PointRobot(0.45, 0.55)
+        cache = robot.enable_collision_cache(maxsize=1000)
+        path = list(np.linspace(0, 1, 101)[1:, np.newaxis])
+        self.assertFalse(robot.path_in_collision(path[:40]))
+        self.assertFalse(robot.path_in_collision(path[:40]))
+        self.assertEqual(len(robot.checked), 40)
+        self.assertEqual((cache.hits, cache.misses), (40, 40))
+        self.assertTrue(robot.in_collision_batch(np.array([[0.5], [0.1]]))[0])
+        self.assertEqual(len(robot.checked), 41)
+
+        robot.disable_collision_cache()
+        self.assertFalse(robot.path_in_collision(path[:40]))
+        self.assertEqual(len(robot.checked), 81)
+
+    def test_collision_cache_batch_invalidation(self):
+        np.random.seed(0)
+        robot = PlanarManipulator(link_parameters=[0.5, 0.5, 0.5])
+        robot.obstacles = MultiPolygon([Point(0.5, 0.5).buffer(0.3)])
+        q = robot.sample_configurations(50)
+        expected = robot.in_collision_batch(q)
+        cache = robot.enable_collision_cache()
+        self.assertTrue(np.array_equal(robot.in_collision_batch(q[:20]), expected[:20]))
+        self.assertTrue(np.array_equal(robot.in_collision_batch(q), expected))
+        self.assertEqual((cache.hits, cache.misses, len(cache)), (20, 50, 50))
+        robot.set_configuration(q[0])
+        self.assertEqual(robot.in_collision(), expected[0])
+        self.assertEqual(cache.hits, 21)
+
+        robot.obstacles = MultiPolygon([Point(-0.5, 0.5).buffer(0.3)])
+        collision = robot.in_collision_batch(q)
+        self.assertEqual(len(cache), 50)
+        self.assertEqual(cache.hits, 21)
+        self.assertTrue(
+            np.array_equal(collision, RobotBase.in_collision_batch(robot, q))
+        )
+        self.assertEqual(cache.hits, 71)
+
+        robot.base_pose.translation[0] += 1.0
+        robot.in_collision_batch(q)
+        self.assertEqual(cache.hits, 71)
+
+
+if __name__ == "__main__":
+    unittest.main()
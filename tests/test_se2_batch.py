@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+#
+# Copyright (c) CTU -- All Rights Reserved
+# Created on: 2026-10-18
+#
+import unittest
+import numpy as np
+
+from robotics_toolbox.core import SE2, SO2, SE2Batch, SO2Batch
+
+
+def random_batch(n: int) -> SE2Batch:
+    return SE2Batch(
+        translation=np.random.uniform(-10, 10, size=(n, 2)),
+        rotation=np.random.uniform(-np.pi, np.pi, size=n),
+    )
+
+
+class TestSE2Batch(unittest.TestCase):
+    def test_initialization(self):
+        self.assertEqual(len(SE2Batch()), 0)
+        b = SE2Batch(translation=np.zeros((5, 2)))
+        self.assertEqual(len(b), 5)
+        self.assertTrue(np.allclose(b.homogeneous(), np.eye(3)))
+        b = SE2Batch(rotation=[0.0, np.pi / 2])
+        self.assertTrue(np.allclose(b.rotation.rot[1], [[0, -1], [1, 0]]))
+        self.assertTrue(np.allclose(b.rotation.angle, [0.0, np.pi / 2]))
+        c = SE2Batch(b.translation, b.rotation.rot)
+        self.assertEqual(b, c)
+
+    def test_composition(self):
+        np.random.seed(0)
+        a, b = random_batch(50), random_batch(50)
+        c = a * b
+        self.assertTrue(np.allclose(c.homogeneous(), a.homogeneous() @ b.homogeneous()))
+
+    def test_composition_broadcast(self):
+        np.random.seed(0)
+        a, b = random_batch(1), random_batch(50)
+        self.assertTrue(
+            np.allclose((a * b).homogeneous(), a.homogeneous() @ b.homogeneous())
+        )
+        self.assertTrue(
+            np.allclose((b * a).homogeneous(), b.homogeneous() @ a.homogeneous())
+        )
+        single = SE2(np.array([1.0, 2.0]), SO2())
+        single.rotation.rot = np.eye(2)
+        self.assertTrue(
+            np.allclose(
+                (b * single).homogeneous(), b.homogeneous() @ single.homogeneous()
+            )
+        )
+
+    def test_inverse(self):
+        np.random.seed(0)
+        a = random_batch(50)
+        self.assertTrue(
+            np.allclose(a.inverse().homogeneous(), np.linalg.inv(a.homogeneous()))
+        )
+
+    def test_act(self):
+        np.random.seed(0)
+        a = random_batch(50)
+        v = np.random.uniform(-1, 1, size=(50, 2))
+        h = a.homogeneous()
+        ref = np.einsum("nij,nj->ni", h, np.pad(v, ((0, 0), (0, 1)), constant_values=1))
+        self.assertTrue(np.allclose(a.act(v), ref[:, :2]))
+        ref = h @ np.array([0.5, -0.5, 1.0])
+        self.assertTrue(np.allclose(a.act([0.5, -0.5]), ref[:, :2]))
+
+    def test_indexing(self):
+        np.random.seed(0)
+        a = random_batch(10)
+        self.assertIsInstance(a[3], SE2)
+        self.assertTrue(np.allclose(a[3].homogeneous(), a.homogeneous()[3]))
+        self.assertEqual(len(a[2:5]), 3)
+        self.assertEqual(SE2Batch.from_poses([a[i] for i in range(len(a))]), a)
+        self.assertIsInstance(a.rotation, SO2Batch)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python
+#
+# Copyright (c) CTU -- All Rights Reserved
+# Created on: 2026-10-18
+#
+import unittest
+import numpy as np
+import pinocchio as pin
+
+from robotics_toolbox.core import SE3, SO3, SE3Batch, SO3Batch
+
+
+def random_rotation_vectors(n: int, max_angle: float = np.pi) -> np.ndarray:
+    axes = np.random.normal(size=(n, 3))
+    axes /= np.linalg.norm(axes, axis=-1, keepdims=True)
+    return np.random.uniform(0, max_angle, size=(n, 1)) * axes
+
+
+def random_batch(n: int) -> SE3Batch:
+    return SE3Batch(
+        translation=np.random.uniform(-10, 10, size=(n, 3)),
+        rotation=SO3Batch.exp(random_rotation_vectors(n)),
+    )
+
+
+class TestSO3Batch(unittest.TestCase):
+    def test_exp(self):
+        np.random.seed(0)
+        v = random_rotation_vectors(100)
+        r = SO3Batch.exp(v)
+        for vi, ri in zip(v, r.rot):
+            self.assertTrue(np.allclose(ri, pin.exp3(vi)))
+
+    def test_exp_small_angle(self):
+        v = np.array([[0.0, 0.0, 0.0], [1e-9, -2e-9, 0.0], [1e-7, 0.0, 0.0]])
+        for vi, ri in zip(v, SO3Batch.exp(v).rot):
+            self.assertTrue(np.allclose(ri, pin.exp3(vi), atol=1e-14))
+
+    def test_log(self):
+        np.random.seed(0)
+        v = random_rotation_vectors(100, max_angle=np.pi - 1e-2)
+        self.assertTrue(np.allclose(SO3Batch.exp(v).log(), v))
+
+    def test_log_small_angle(self):
+        v = np.array([[0.0, 0.0, 0.0], [1e-9, -2e-9, 0.0], [1e-7, 0.0, 3e-7]])
+        self.assertTrue(np.allclose(SO3Batch.exp(v).log(), v, atol=1e-14))
+
+    def test_log_near_pi(self):
+        np.random.seed(0)
+        v = random_rotation_vectors(100, max_angle=1.0)
+        v /= np.linalg.norm(v, axis=-1, keepdims=True)
+        v *= np.random.uniform(np.pi - 1e-2, np.pi, size=(100, 1))
+        r = SO3Batch.exp(v)
+        w = r.log()
+        self.assertTrue(np.all(np.linalg.norm(w, axis=-1) <= np.pi + 1e-9))
+        self.assertTrue(np.allclose(SO3Batch.exp(w).rot, r.rot))
+
+    def test_composition_inverse_act(self):
+        np.random.seed(0)
+        a = SO3Batch.exp(random_rotation_vectors(20))
+        b = SO3Batch.exp(random_rotation_vectors(20))
+        self.assertTrue(np.allclose((a * b).rot, a.rot @ b.rot))
+        self.assertTrue(np.allclose((a * a.inverse()).rot, np.eye(3)))
+        v = np.random.uniform(-1, 1, size=(20, 3))
+        self.assertTrue(np.allclose(a.act(v), np.einsum("nij,nj->ni", a.rot, v)))
+        self.assertIsInstance(a[0], SO3)
+
+
+class TestSE3Batch(unittest.TestCase):
+    def test_composition(self):
+        np.random.seed(0)
+        a, b = random_batch(50), random_batch(50)
+        self.assertTrue(
+            np.allclose((a * b).homogeneous(), a.homogeneous() @ b.homogeneous())
+        )
+        self.assertTrue(
+            np.allclose(
+                (a[:1] * b).homogeneous(), a.homogeneous()[:1] @ b.homogeneous()
+            )
+        )
+
+    def test_inverse(self):
+        np.random.seed(0)
+        a = random_batch(50)
+        self.assertTrue(
+            np.allclose(a.inverse().homogeneous(), np.linalg.inv(a.homogeneous()))
+        )
+
+    def test_act(self):
+        np.random.seed(0)
+        a = random_batch(50)
+        v = np.random.uniform(-1, 1, size=(50, 3))
+        ref = np.einsum(
+            "nij,nj->ni",
+            a.homogeneous(),
+            np.pad(v, ((0, 0), (0, 1)), constant_values=1),
+        )
+        self.assertTrue(np.allclose(a.act(v), ref[:, :3]))
+
+    def test_indexing(self):
+        np.random.seed(0)
+        a = random_batch(10)
+        self.assertIsInstance(a[3], SE3)
+        self.assertTrue(np.allclose(a[3].homogeneous(), a.homogeneous()[3]))
+        self.assertEqual(SE3Batch.from_poses([a[i] for i in range(len(a))]), a)
+
+
+if __name__ == "__main__":
+    unittest.main()
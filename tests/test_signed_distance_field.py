@@ -0,0 +1,41 @@
+#!/usr/bin/env python
+#
+# Copyright (c) CTU -- All Rights Reserved
+# Created on: 2026-10-18
+#
+import unittest
+import numpy as np
+from shapely import MultiPolygon, Point, Polygon, points
+
+from robotics_toolbox.utils import SignedDistanceField
+
+
+class TestSignedDistanceField(unittest.TestCase):
+    def test_values(self):
+        np.random.seed(0)
+        obstacles = MultiPolygon(
+            [
+                Point(0.2, 0.3).buffer(0.3),
+                Polygon([(-0.8, -0.8), (-0.2, -0.8), (-0.5, -0.2)]),
+            ]
+        )
+        sdf = SignedDistanceField(obstacles, [-1, -1], [1, 1], resolution=0.02)
+        self.assertEqual(sdf.values.shape, (101, 101))
+        p = np.random.uniform(-1, 1, size=(1000, 2))
+        distance = obstacles.boundary.distance(points(p))
+        expected = np.where(obstacles.contains(points(p)), -distance, distance)
+        error = np.abs(sdf.value(p) - expected)
+        self.assertTrue(np.all(error <= sdf.margin + 1e-12))
+        self.assertTrue(np.any(expected < 0))
+
+    def test_outside_and_empty(self):
+        sdf = SignedDistanceField(None, [0, 0], [1, 2], resolution=0.5)
+        self.assertEqual(sdf.values.shape, (3, 5))
+        self.assertTrue(np.all(np.isinf(sdf.values)))
+        values = sdf.value([[0.5, 0.5], [1.5, 0.5], [-0.5, 0.0]])
+        self.assertTrue(np.isinf(values[0]))
+        self.assertTrue(np.all(np.isnan(values[1:])))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+#
+# Copyright (c) CTU -- All Rights Reserved
+# Created on: 2026-10-18
+#
+import unittest
+import numpy as np
+import pinocchio as pin
+
+from robotics_toolbox.core import SO3, SE3, SO3Quaternion
+
+
+def random_rotation_vector(max_angle: float = np.pi) -> np.ndarray:
+    axis = np.random.normal(size=3)
+    return np.random.uniform(0, max_angle) * axis / np.linalg.norm(axis)
+
+
+class TestSO3Quaternion(unittest.TestCase):
+    def test_exp_log(self):
+        np.random.seed(0)
+        for _ in range(100):
+            v = random_rotation_vector(np.pi - 1e-3)
+            q = SO3Quaternion.exp(v)
+            self.assertTrue(np.allclose(q.rot, pin.exp3(v)))
+            self.assertTrue(np.allclose(q.log(), v))
+        self.assertTrue(np.allclose(SO3Quaternion.exp(np.zeros(3)).rot, np.eye(3)))
+        self.assertTrue(
+            np.allclose(SO3Quaternion.exp([1e-9, 0, 0]).log(), [1e-9, 0, 0])
+        )
+
+    def test_from_to_so3(self):
+        np.random.seed(0)
+        for _ in range(100):
+            r = SO3(pin.exp3(random_rotation_vector()))
+            q = SO3Quaternion.from_so3(r)
+            self.assertAlmostEqual(np.linalg.norm(q.q), 1.0)
+            self.assertTrue(np.allclose(q.rot, r.rot))
+            self.assertTrue(np.allclose(q.to_so3().rot, r.rot))
+            self.assertEqual(q, r)
+            self.assertEqual(q.key(), r.key())
+
+    def test_composition_inverse_act(self):
+        np.random.seed(0)
+        for _ in range(100):
+            a = SO3Quaternion.exp(random_rotation_vector())
+            b = SO3Quaternion.exp(random_rotation_vector())
+            self.assertTrue(np.allclose((a * b).rot, a.rot @ b.rot))
+            self.assertTrue(np.allclose(a.inverse().rot, a.rot.T))
+            v = np.random.uniform(-1, 1, size=(10, 3))
+            self.assertTrue(np.allclose(a.act(v), v @ a.rot.T))
+            rot = a.rot
+            a.compose_into(b, a)
+            self.assertTrue(np.allclose(a.rot, rot @ b.rot))
+
+    def test_renormalization(self):
+        np.random.seed(0)
+        a = SO3Quaternion.exp(random_rotation_vector())
+        a.q *= 1.0 + 1e-6
+        step = SO3Quaternion.exp(random_rotation_vector(0.1))
+        for _ in range(SO3Quaternion.RENORMALIZATION_PERIOD):
+            a.compose_into(step, a)
+        self.assertAlmostEqual(np.linalg.norm(a.q), 1.0, places=12)
+
+    def test_input_not_modified(self):
+        q = np.array([0.0, 0.0, 2.0, 0.0])
+        a = SO3Quaternion(q).normalize()
+        a.compose_into(SO3Quaternion.exp([0.1, 0.2, 0.3]), a)
+        self.assertTrue(np.array_equal(q, [0.0, 0.0, 2.0, 0.0]))
+
+    def test_slerp(self):
+        np.random.seed(0)
+        a = SO3Quaternion.exp(random_rotation_vector())
+        v = random_rotation_vector(np.pi / 2)
+        b = a * SO3Quaternion.exp(v)
+        self.assertEqual(a.slerp(b, 0.0), a)
+        self.assertEqual(a.slerp(b, 1.0), b)
+        self.assertEqual(a.slerp(b, 0.25), a * SO3Quaternion.exp(0.25 * v))
+
+    def test_rotation_of_se3(self):
+        np.random.seed(0)
+        a = SE3(
+            np.random.uniform(-1, 1, 3), SO3Quaternion.exp(random_rotation_vector())
+        )
+        b = SE3(
+            np.random.uniform(-1, 1, 3), SO3Quaternion.exp(random_rotation_vector())
+        )
+        ref = a.homogeneous() @ b.homogeneous()
+        a.compose_into(b, b)
+        self.assertTrue(np.allclose(b.homogeneous(), ref))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,189 @@
+#!/usr/bin/env python
+#
+# Copyright (c) CTU -- All Rights Reserved
+# Created on: 2026-10-18
+#
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+import numpy as np
+import pinocchio as pin
+
+from robotics_toolbox.robots import SpatialManipulator
+
+N_LINKS = 5
+
+
+def chain_urdf(length: float = 0.3) -> str:
+    """URDF of a serial chain of boxes connected by revolute joints."""
+    links = [f"""
+    <link name="link_{i}">
+        <collision>
+            <origin xyz="{length / 2} 0 0" rpy="0 0 0"/>
+            <geometry><box size="{length} 0.06 0.06"/></geometry>
+        </collision>
+    </link>""" for i in range(N_LINKS)]
+    joints = [f"""
+    <joint name="joint_{i}" type="revolute">
+        <origin xyz="{length if i > 0 else 0} 0 0" rpy="0 0 0"/>
+        <parent link="{'base_link' if i == 0 else f'link_{i - 1}'}"/>
+        <child link="link_{i}"/>
+        <axis xyz="0 {1 if i == 2 else 0} {0 if i == 2 else 1}"/>
+        <limit effort="30" velocity="1.0" lower="-3.0" upper="3.0" />
+    </joint>""" for i in range(N_LINKS)]
+    return f"""<robot name="chain">
+    <link name="base_link"/>{''.join(links)}{''.join(joints)}
+</robot>
+"""
+
+
+def chain_srdf() -> str:
+    """SRDF disabling collisions of the adjacent links."""
+    pairs = [
+        f'    <disable_collisions link1="link_{i}" link2="link_{i + 1}" '
+        'reason="Adjacent"/>'
+        for i in range(N_LINKS - 1)
+    ]
+    return '<robot name="chain">\n' + "\n".join(pairs) + "\n</robot>\n"
+
+
+class TestSpatialManipulator(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.urdf = Path(self.tmp.name).joinpath("chain.urdf")
+        self.srdf = Path(self.tmp.name).joinpath("chain.srdf")
+        self.urdf.write_text(chain_urdf())
+        self.srdf.write_text(chain_srdf())
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def robot(self, **kwargs) -> SpatialManipulator:
+        return SpatialManipulator(
+            urdf_path=self.urdf, srdf_path=self.srdf, headless=True, **kwargs
+        )
+
+    def test_in_collision_batch_matches_serial(self):
+        np.random.seed(0)
+        robot = self.robot()
+        q = robot.sample_configurations(200)
+        expected = [robot.set_configuration(qi).in_collision() for qi in q]
+        self.assertTrue(0 < np.mean(expected) < 1)
+        robot.set_configuration(np.zeros(robot.dof))
+        for max_workers in (1, 4, 16):
+            collision = robot.in_collision_batch(q, max_workers=max_workers)
+            self.assertTrue(np.array_equal(collision, expected))
+        self.assertTrue(np.array_equal(robot.q, np.zeros(robot.dof)))
+        self.assertTrue(np.array_equal(robot.in_collision_batch(q[:3]), expected[:3]))
+        self.assertEqual(robot.in_collision_batch(q[:0]).shape, (0,))
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = executor.map(
+                lambda k: robot.in_collision_batch(q[k::4], max_workers=2), range(4)
+            )
+            for k, collision in enumerate(results):
+                self.assertTrue(np.array_equal(collision, expected[k::4]))
+
+    def test_in_collision_matches_pinocchio(self):
+        """Hot pairs and broad phase give the same result as checking all pairs."""
+        np.random.seed(0)
+        robot = self.robot()
+        model, geom_model = robot._model, robot._geom_model
+        data, geom_data = model.createData(), geom_model.createData()
+        q = robot.sample_configurations(500)
+        expected = [
+            pin.computeCollisions(model, data, geom_model, geom_data, qi, True)
+            for qi in q
+        ]
+        self.assertTrue(0 < np.mean(expected) < 1)
+        for n_hot in (0, 1, 4):
+            robot.n_hot_collision_pairs = n_hot
+            self.assertEqual([robot.in_collision_at(qi) for qi in q], expected)
+            self.assertLessEqual(len(robot._thread_local.hot_pairs), n_hot)
+        collision = robot.in_collision_batch(q, max_workers=8)
+        self.assertTrue(np.array_equal(collision, expected))
+
+    def test_model_data_of_exercises(self):
+        """Model and data are accessed directly by the lab02 exercises."""
+        np.random.seed(0)
+        urdf = Path(__file__).parents[1].joinpath("exercises/lab02/robot.urdf")
+        for robot in (self.robot(), SpatialManipulator(urdf_path=urdf, headless=True)):
+            self.assertIsInstance(robot._data, pin.Data)
+            self.assertEqual(len(robot._data.oMf), robot._model.nframes)
+            q = robot.sample_configuration()
+            pin.forwardKinematics(robot._model, robot._data, q)
+            pin.updateFramePlacements(robot._model, robot._data)
+            name = robot._model.frames[robot._model.nframes - 1].name
+            expected = robot.flange_pose_at(q, name)
+            f = robot._data.oMf[robot._model.nframes - 1].homogeneous
+            self.assertTrue(np.allclose(f[:3, 3], expected.translation))
+            self.assertTrue(np.allclose(f[:3, :3], expected.rotation.rot))
+
+    def cache_files(self, cache_dir: Path) -> dict[str, int]:
+        """Return cache file names and their inodes, rewritten files change inode."""
+        return {p.name: p.stat().st_ino for p in Path(cache_dir).iterdir()}
+
+    def assert_same_models(self, a: SpatialManipulator, b: SpatialManipulator):
+        self.assertEqual(a._model.nq, b._model.nq)
+        self.assertEqual(
+            [f.name for f in a._model.frames], [f.name for f in b._model.frames]
+        )
+        self.assertEqual(
+            [(p.first, p.second) for p in a._geom_model.collisionPairs],
+            [(p.first, p.second) for p in b._geom_model.collisionPairs],
+        )
+        q = a.sample_configurations(50)
+        self.assertTrue(
+            np.array_equal(a.in_collision_batch(q), b.in_collision_batch(q))
+        )
+
+    def test_model_cache(self):
+        np.random.seed(0)
+        reference = self.robot()
+        with tempfile.TemporaryDirectory() as cache_dir:
+            self.assert_same_models(reference, self.robot(cache_dir=cache_dir))
+            files = self.cache_files(cache_dir)
+            self.assertEqual(len(files), 2)
+            self.assert_same_models(reference, self.robot(cache_dir=cache_dir))
+            self.assertEqual(self.cache_files(cache_dir), files)
+
+    def test_model_cache_invalidation(self):
+        np.random.seed(0)
+        with tempfile.TemporaryDirectory() as cache_dir:
+            robot = self.robot(cache_dir=cache_dir)
+            self.urdf.write_text(chain_urdf(length=0.4))
+            modified = self.robot(cache_dir=cache_dir)
+            self.assertEqual(len(self.cache_files(cache_dir)), 4)
+            self.assert_same_models(modified, self.robot())
+            q = np.zeros(robot.dof)
+            self.assertAlmostEqual(
+                modified.flange_pose_at(q, "link_4").translation[0],
+                robot.flange_pose_at(q, "link_4").translation[0] + 0.4,
+            )
+
+            self.srdf.write_text('<robot name="chain">\n</robot>\n')
+            modified = self.robot(cache_dir=cache_dir)
+            self.assertEqual(len(self.cache_files(cache_dir)), 6)
+            self.assert_same_models(modified, self.robot())
+            self.assertGreater(
+                len(modified._geom_model.collisionPairs),
+                len(robot._geom_model.collisionPairs),
+            )
+
+    def test_model_cache_corrupted(self):
+        np.random.seed(0)
+        reference = self.robot()
+        with tempfile.TemporaryDirectory() as cache_dir:
+            self.robot(cache_dir=cache_dir)
+            for i, path in enumerate(sorted(Path(cache_dir).iterdir())):
+                content = path.read_bytes()
+                path.write_bytes(content[: len(content) // 2] if i == 0 else b"")
+                self.assert_same_models(reference, self.robot(cache_dir=cache_dir))
+            files = self.cache_files(cache_dir)
+            self.assert_same_models(reference, self.robot(cache_dir=cache_dir))
+            self.assertEqual(self.cache_files(cache_dir), files)
+
+
+if __name__ == "__main__":
+    unittest.main()